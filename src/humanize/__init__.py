@@ -2,39 +2,53 @@
 
 from __future__ import annotations
 
-__lazy_modules__ = {
-    "humanize._version",
-    "humanize.filesize",
-    "humanize.i18n",
-    "humanize.lists",
-    "humanize.number",
-    "humanize.time",
-}
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from humanize import stream as stream
+    from humanize.filesize import SizeFormatter, naturalsize, naturalsize_many
+    from humanize.i18n import (
+        activate,
+        deactivate,
+        decimal_separator,
+        thousands_separator,
+    )
+    from humanize.lists import natural_list
+    from humanize.number import (
+        NumberFormatter,
+        apnumber,
+        clamp,
+        fractional,
+        fractional_many,
+        intcomma,
+        intword,
+        intword_many,
+        metric,
+        metric_many,
+        ordinal,
+        ordinal_many,
+        scientific,
+        scientific_many,
+    )
+    from humanize.time import (
+        DeltaFormatter,
+        PreciseDeltaFormatter,
+        naturaldate,
+        naturalday,
+        naturaldelta,
+        naturaltime,
+        naturaltime_many,
+        precisedelta,
+    )
 
-from humanize.filesize import naturalsize
-from humanize.i18n import activate, deactivate, decimal_separator, thousands_separator
-from humanize.lists import natural_list
-from humanize.number import (
-    apnumber,
-    clamp,
-    fractional,
-    intcomma,
-    intword,
-    metric,
-    ordinal,
-    scientific,
-)
-from humanize.time import (
-    naturaldate,
-    naturalday,
-    naturaldelta,
-    naturaltime,
-    precisedelta,
-)
-
-from ._version import __version__
+    from ._version import __version__
 
 __all__ = [
+    "DeltaFormatter",
+    "NumberFormatter",
+    "PreciseDeltaFormatter",
+    "SizeFormatter",
     "__version__",
     "activate",
     "apnumber",
@@ -42,17 +56,82 @@ __all__ = [
     "deactivate",
     "decimal_separator",
     "fractional",
+    "fractional_many",
     "intcomma",
     "intword",
+    "intword_many",
     "metric",
+    "metric_many",
     "natural_list",
     "naturaldate",
     "naturalday",
     "naturaldelta",
     "naturalsize",
+    "naturalsize_many",
     "naturaltime",
+    "naturaltime_many",
     "ordinal",
+    "ordinal_many",
     "precisedelta",
     "scientific",
+    "scientific_many",
     "thousands_separator",
 ]
+
+# `import humanize` only runs this file: each public name is imported from its
+# submodule on first access by `__getattr__`, then cached in the module globals.
+_SUBMODULES = {"filesize", "i18n", "instrument", "lists", "number", "stream", "time"}
+_EXPORTS = {
+    "DeltaFormatter": "time",
+    "NumberFormatter": "number",
+    "PreciseDeltaFormatter": "time",
+    "SizeFormatter": "filesize",
+    "__version__": "_version",
+    "activate": "i18n",
+    "apnumber": "number",
+    "clamp": "number",
+    "deactivate": "i18n",
+    "decimal_separator": "i18n",
+    "fractional": "number",
+    "fractional_many": "number",
+    "intcomma": "number",
+    "intword": "number",
+    "intword_many": "number",
+    "metric": "number",
+    "metric_many": "number",
+    "natural_list": "lists",
+    "naturaldate": "time",
+    "naturalday": "time",
+    "naturaldelta": "time",
+    "naturalsize": "filesize",
+    "naturalsize_many": "filesize",
+    "naturaltime": "time",
+    "naturaltime_many": "time",
+    "ordinal": "number",
+    "ordinal_many": "number",
+    "precisedelta": "time",
+    "scientific": "number",
+    "scientific_many": "number",
+    "thousands_separator": "i18n",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name or submodule the first time it is accessed."""
+    import importlib
+
+    if name in _SUBMODULES:
+        module: ModuleType = importlib.import_module(f"{__name__}.{name}")
+        return module
+    if name not in _EXPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not imported yet."""
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -0,0 +1,213 @@
+"""Memory-mapped gettext catalogs.
+
+Kept apart from `humanize.i18n` so that `gettext` is only imported once a
+translation is loaded.
+"""
+
+from __future__ import annotations
+
+import gettext as gettext_module
+import sys
+from functools import lru_cache
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Callable
+    from typing import Any
+
+__all__ = ["MappedCatalog", "MappedTranslations", "memoize_plural"]
+
+_MISSING = object()
+
+# Plural indexes of the counts below this are computed when a catalog is opened
+_DENSE_PLURALS = 128
+
+
+class MappedCatalog:
+    """Read-only view of the message tables of a memory-mapped `.mo` file.
+
+    The `.mo` format stores its original strings sorted, so messages are found by
+    binary search over the mapped file and decoded only when first looked up.
+    Opening a catalog therefore reads nothing but its header. Keys follow
+    `GNUTranslations._catalog`: a msgid for singular messages and a
+    `(msgid, index)` tuple for each plural form.
+    """
+
+    def __init__(
+        self, buf: mmap.mmap, order: str, count: int, masters: int, translations: int
+    ) -> None:
+        import struct
+
+        self._buf = buf
+        self._entry = struct.Struct(order + "II")
+        self._count = count
+        self._masters = masters
+        self._translations = translations
+        self._decoded: dict[Any, Any] = {}
+        self.charset = "ascii"
+
+    def _string(self, table: int, index: int) -> bytes:
+        length, offset = self._entry.unpack_from(self._buf, table + 8 * index)
+        return self._buf[offset : offset + length]
+
+    def _search(self, msgid: bytes) -> int:
+        # Plural entries are stored as "msgid\0msgid_plural" and sorted on msgid
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(self._masters, mid).partition(b"\0")[0] < msgid:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _lookup(self, key: Any) -> Any:
+        plural = isinstance(key, tuple)
+        msgid, form = key if plural else (key, 0)
+        try:
+            encoded = msgid.encode(self.charset)
+        except (AttributeError, UnicodeError):
+            return _MISSING
+
+        index = self._search(encoded)
+        if index == self._count:
+            return _MISSING
+        original, sep, _ = self._string(self._masters, index).partition(b"\0")
+        if original != encoded or bool(sep) != plural:
+            return _MISSING
+
+        translated = self._string(self._translations, index)
+        if plural:
+            forms = translated.split(b"\0")
+            if not 0 <= form < len(forms):
+                return _MISSING
+            translated = forms[form]
+        return str(translated, self.charset)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def load(self) -> None:
+        """Decode every message up front, as `GNUTranslations` does on open."""
+        for index in range(self._count):
+            original = self._string(self._masters, index)
+            translated = str(self._string(self._translations, index), self.charset)
+            if b"\0" in original:
+                msgid = str(original.partition(b"\0")[0], self.charset)
+                for form, message in enumerate(translated.split("\0")):
+                    self._decoded[msgid, form] = message
+            else:
+                self._decoded[str(original, self.charset)] = translated
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            value = self._decoded[key]
+        except KeyError:
+            value = self._decoded[key] = self._lookup(key)
+        return default if value is _MISSING else value
+
+
+class MappedTranslations(gettext_module.GNUTranslations):
+    """`GNUTranslations` that looks messages up in place in a memory-mapped `.mo`.
+
+    Falls back to the regular parser when the file cannot be mapped. Either way,
+    the plural index of each integer is memoized, see `memoize_plural`.
+    """
+
+    _info: dict[str, str]
+    plural: Callable[[int], int]
+
+    def _parse(self, fp: Any) -> None:
+        import mmap
+        import struct
+
+        # The mapping lives as long as the catalog, which is never released. On
+        # Unix, mmap keeps a duplicate of the file descriptor unless told not to
+        # (Python 3.13+), so older versions hold one open per loaded locale.
+        extra: dict[str, bool] = {}
+        if sys.version_info >= (3, 13) and sys.platform != "win32":
+            extra["trackfd"] = False
+        try:
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ, **extra)
+        except (OSError, ValueError):
+            super()._parse(fp)
+            self.plural = memoize_plural(self.plural)
+            return
+
+        filename = getattr(fp, "name", "")
+        if len(buf) < 20:
+            raise OSError(0, "File is corrupt", filename)
+        (magic,) = struct.unpack_from("<I", buf)
+        if magic == self.LE_MAGIC:
+            order = "<"
+        elif magic == self.BE_MAGIC:
+            order = ">"
+        else:
+            raise OSError(0, "Bad magic number", filename)
+
+        version, count, masters, translations = struct.unpack_from(order + "4I", buf, 4)
+        if version >> 16 not in self.VERSIONS:
+            raise OSError(0, f"Bad version number {version >> 16}", filename)
+        if max(masters, translations) + 8 * count > len(buf):
+            raise OSError(0, "File is corrupt", filename)
+
+        self._catalog = catalog = MappedCatalog(
+            buf, order, count, masters, translations
+        )
+        self.plural = lambda n: int(n != 1)
+        if count and not catalog._string(masters, 0):
+            self._parse_header(catalog._string(translations, 0))
+        catalog.charset = self._charset or "ascii"
+        self.plural = memoize_plural(self.plural)
+
+    def _parse_header(self, header: bytes) -> None:
+        # Same metadata handling as GNUTranslations._parse
+        last = None
+        for line in header.split(b"\n"):
+            item = line.decode().strip()
+            if not item or (
+                item.startswith("#-#-#-#-#") and item.endswith("#-#-#-#-#")
+            ):
+                continue
+            if ":" not in item:
+                if last:
+                    self._info[last] += "\n" + item
+                continue
+            k, v = item.split(":", 1)
+            k, v = k.strip().lower(), v.strip()
+            self._info[k] = v
+            last = k
+            if k == "content-type":
+                self._charset = v.split("charset=")[1]
+            elif k == "plural-forms":
+                plural = v.split(";")[1].split("plural=")[1]
+                self.plural = gettext_module.c2py(plural)
+
+
+def memoize_plural(plural: Callable[[int], int]) -> Callable[[int], int]:
+    """Return `plural` with its results for integers memoized.
+
+    `gettext` compiles the `Plural-Forms` expression of a catalog into Python code
+    that is evaluated on every `ngettext` call. The index of each count below
+    `_DENSE_PLURALS` is computed up front, and those of larger counts are kept in a
+    bounded cache. Other numbers are passed to `plural` as they are, so its handling
+    of floats is unchanged.
+    """
+    dense = tuple(plural(n) for n in range(_DENSE_PLURALS))
+    cached = lru_cache(maxsize=1024)(plural)
+
+    def plural_index(n: int) -> int:
+        if n.__class__ is not int:
+            return plural(n)
+        if 0 <= n < _DENSE_PLURALS:
+            return dense[n]
+        return cached(n)
+
+    return plural_index
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 __lazy_modules__ = {"humanize.i18n", "math"}
 
+import sys
 from math import log
 
 from humanize.i18n import _gettext as _
+from humanize.number import _numeric_array
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
 
 suffixes = {
     "decimal": (
@@ -37,6 +44,10 @@ suffixes = {
 }
 
 
+# A printf-style fixed-point format, such as "%.1f" or "%8.3f"
+_FIXED_POINT = r"%[-+ #0]*\d*(\.\d*)?f"
+
+
 def naturalsize(
     value: float | str,
     binary: bool = False,
@@ -108,3 +119,191 @@ def naturalsize(
     space = "" if gnu else " "
     ret: str = format % (bytes_ / (base**exp)) + space + _(suffix[exp - 1])
     return ret
+
+
+def naturalsize_many(
+    values: Iterable[float | str],
+    binary: bool = False,
+    gnu: bool = False,
+    format: str = "%.1f",
+) -> list[str]:
+    """Format many numbers of bytes like human-readable filesizes.
+
+    The result is the same as calling `naturalsize` on each element, but the suffix
+    table, base and translated strings are resolved once for the whole batch. Any
+    iterable of numbers or numeric strings works. For a NumPy array of numbers, the
+    suffixes are picked with vectorised operations.
+
+    Examples:
+        ```pycon
+        >>> naturalsize_many([1, 300, 3000000])
+        ['1 Byte', '300 Bytes', '3.0 MB']
+        >>> naturalsize_many([300, 3000], gnu=True)
+        ['300B', '2.9K']
+        >>> naturalsize_many(["1024", -4096], binary=True)
+        ['1.0 KiB', '-4.0 KiB']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Integers to convert.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+
+    Returns:
+        list[str]: Human readable representations of the filesizes, in order.
+    """
+    return SizeFormatter(binary, gnu, format).format_many(values)
+
+
+class SizeFormatter:
+    """Format numbers of bytes with fixed options, in the locale active at creation.
+
+    The suffix table, base and translated strings that `naturalsize` resolves on
+    every call are resolved once, when the formatter is created. Activating another
+    locale later does not change the output of an existing formatter.
+
+    Examples:
+        ```pycon
+        >>> fmt = SizeFormatter(binary=True)
+        >>> fmt(3000)
+        '2.9 KiB'
+        >>> fmt.format_many([1, 1024**3])
+        ['1 Byte', '1.0 GiB']
+
+        ```
+    """
+
+    def __init__(
+        self, binary: bool = False, gnu: bool = False, format: str = "%.1f"
+    ) -> None:
+        """Bind the options and the current locale.
+
+        Args:
+            binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+                2<sup>10</sup> instead of 10<sup>3</sup>.
+            gnu (bool): If `True`, the binary argument is ignored and GNU-style
+                (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+            format (str): Custom formatter.
+        """
+        if gnu:
+            suffix = suffixes["gnu"]
+        elif binary:
+            suffix = suffixes["binary"]
+        else:
+            suffix = suffixes["decimal"]
+
+        self.binary = binary
+        self.gnu = gnu
+        self.format = format
+        self._base = 1024 if (gnu or binary) else 1000
+        if gnu:
+            self._one = self._many = "%dB"
+        else:
+            self._one = _("%d Byte")
+            self._many = _("%d Bytes")
+        space = "" if gnu else " "
+        self._units = [space + _(unit) for unit in suffix]
+        # Dividing a float by an int converts the int to a float first, so dividing
+        # by these precomputed floats gives the same mantissas as `naturalsize`.
+        self._scales = [float(self._base**exp) for exp in range(len(suffix) + 1)]
+
+    def __call__(self, value: float | str) -> str:
+        """Same as `naturalsize(value, binary, gnu, format)`."""
+        bytes_ = float(value)
+        abs_bytes = abs(bytes_)
+        base = self._base
+        if abs_bytes < base:
+            return (self._one if abs_bytes == 1 else self._many) % int(bytes_)
+
+        format = self.format
+        scales = self._scales
+        last = len(self._units)
+        exp = int(min(log(abs_bytes, base), last))
+        # Step up one suffix when rounding carries the mantissa to `base`, as in
+        # `naturalsize`.
+        if exp < last and abs(float(format % (abs_bytes / scales[exp]))) >= base:
+            exp += 1
+        return format % (bytes_ / scales[exp]) + self._units[exp - 1]
+
+    def format_many(self, values: Iterable[float | str]) -> list[str]:
+        """Same as calling the formatter on each value."""
+        array = _numeric_array(values)
+        if array is not None:
+            if not sys.modules["numpy"].isnan(array).any():
+                return self._format_array(array)
+
+        base = self._base
+        one = self._one
+        many = self._many
+        units = self._units
+        scales = self._scales
+        format = self.format
+        last = len(units)
+
+        result: list[str] = []
+        append = result.append
+        for value in values:
+            bytes_ = float(value)
+            abs_bytes = abs(bytes_)
+            if abs_bytes < base:
+                append((one if abs_bytes == 1 else many) % int(bytes_))
+                continue
+
+            exp = int(min(log(abs_bytes, base), last))
+            if exp < last and abs(float(format % (abs_bytes / scales[exp]))) >= base:
+                exp += 1
+            append(format % (bytes_ / scales[exp]) + units[exp - 1])
+        return result
+
+    def _format_array(self, array: Any) -> list[str]:
+        """Implement `format_many` for a 1-D NumPy array of numbers without NaNs."""
+        import math
+        import re
+
+        np = sys.modules["numpy"]
+        base = self._base
+        one = self._one
+        many = self._many
+        units = self._units
+        format = self.format
+        last = len(units)
+
+        bytes_ = array.astype(np.float64)
+        abs_bytes = np.abs(bytes_)
+        large = abs_bytes >= base
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.log(abs_bytes) / math.log(base)
+            # NumPy's log can differ from math.log in the last bit, which only
+            # matters when the exponent is near an integer: redo those with
+            # math.log like `naturalsize`.
+            near_integers = large & (np.abs(logs - np.rint(logs)) < 1e-9)
+        for i in np.flatnonzero(near_integers).tolist():
+            logs[i] = math.log(abs_bytes[i], base)
+        exps = np.where(large, np.minimum(logs, last), 0).astype(np.int64)
+
+        # Rounding can carry the mantissa up to `base`, as in `naturalsize`. With a
+        # fixed-point format it rounds up by at most 0.5, so only check mantissas
+        # that close to `base`.
+        scales = np.array(self._scales)
+        probe = large & (exps < last)
+        if re.fullmatch(_FIXED_POINT, format):
+            probe &= abs_bytes / scales[exps] >= base - 0.5
+        for i in np.flatnonzero(probe).tolist():
+            if abs(float(format % (abs_bytes[i] / scales[exps[i]]))) >= base:
+                exps[i] += 1
+
+        mantissas = (bytes_ / scales[exps]).tolist()
+        result: list[str] = []
+        append = result.append
+        for value, abs_value, exp, mantissa in zip(
+            bytes_.tolist(), abs_bytes.tolist(), exps.tolist(), mantissas
+        ):
+            if abs_value < base:
+                append((one if abs_value == 1 else many) % int(value))
+            else:
+                append(format % mantissa + units[exp - 1])
+        return result
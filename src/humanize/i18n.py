@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
-import gettext as gettext_module
-from threading import local
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     import os
     import pathlib
-
-__all__ = ["activate", "deactivate", "decimal_separator", "thousands_separator"]
-
-_TRANSLATIONS: dict[str | None, gettext_module.NullTranslations] = {
-    None: gettext_module.NullTranslations()
-}
-_CURRENT = local()
+    from collections.abc import Iterable, Iterator
+    from gettext import NullTranslations
+    from threading import Lock
+    from typing import TypeAlias
+
+    _Translations: TypeAlias = "NullTranslations | _IdentityTranslations"
+
+__all__ = [
+    "activate",
+    "deactivate",
+    "decimal_separator",
+    "locale",
+    "preload",
+    "thousands_separator",
+]
+
+# Thread safety: the active locale is stored in the context variable `_CURRENT`, so
+# each thread, and each asyncio task, sees only its own activate() and deactivate()
+# calls. The tables below are shared by all threads. Entries are only ever added,
+# never replaced, so reads need no lock. A catalog is loaded by one thread at a time
+# per locale, holding that locale's lock in `_LOAD_LOCKS`; threads activating the
+# same locale meanwhile wait for it and reuse the result.
+_TRANSLATIONS: dict[str, NullTranslations] = {}
+_LOAD_LOCKS: dict[str, Lock] = {}
+_CURRENT: ContextVar[str | None] = ContextVar("humanize_locale", default=None)
 
 
 # Mapping of locale to thousands separator
@@ -38,6 +56,36 @@ _DECIMAL_SEPARATOR: dict[str | None, str] = {
     "lv": ",",
 }
 
+# Mapping of locale to the `str.translate` table turning "," and "." into its
+# separators, or `None` when the defaults apply
+_SEPARATOR_TABLE: dict[str | None, dict[int, int] | None] = {}
+
+
+class _IdentityTranslations:
+    """What humanize translates with when no locale is active: messages as is.
+
+    Has the methods of `gettext.NullTranslations` that humanize uses, without
+    importing `gettext`. `activate()` and `get_translation()` return a real
+    `NullTranslations` instead.
+    """
+
+    def gettext(self, message: str) -> str:
+        return message
+
+    def ngettext(self, msgid1: str, msgid2: str, n: int) -> str:
+        return msgid1 if n == 1 else msgid2
+
+    def pgettext(self, context: str, message: str) -> str:
+        return message
+
+    def npgettext(self, context: str, msgid1: str, msgid2: str, n: int) -> str:
+        return msgid1 if n == 1 else msgid2
+
+
+_IDENTITY = _IdentityTranslations()
+# The `gettext.NullTranslations` returned for no locale, created on first use
+_NULL_TRANSLATIONS: NullTranslations | None = None
+
 
 def _get_default_locale_path() -> pathlib.Path | None:
     package = __spec__ and __spec__.parent
@@ -50,17 +98,48 @@ def _get_default_locale_path() -> pathlib.Path | None:
         return pkg / "locale"
 
 
-def get_translation() -> gettext_module.NullTranslations:
-    return _TRANSLATIONS.get(getattr(_CURRENT, "locale", None), _TRANSLATIONS[None])
+def _get_locale() -> str | None:
+    """Return the active locale, or `None` when no translation is active."""
+    return _CURRENT.get()
+
+
+def get_translation() -> NullTranslations:
+    locale = _CURRENT.get()
+    if locale is None or locale not in _TRANSLATIONS:
+        return _null_translations()
+    return _TRANSLATIONS[locale]
+
+
+def _current_translation() -> _Translations:
+    """Return what the active locale translates with, without importing gettext."""
+    locale = _CURRENT.get()
+    if locale is None:
+        return _IDENTITY
+    return _TRANSLATIONS.get(locale, _IDENTITY)
+
+
+def _null_translations() -> NullTranslations:
+    """Return the translation of no locale, importing gettext the first time."""
+    global _NULL_TRANSLATIONS
+    if _NULL_TRANSLATIONS is None:
+        import gettext
+
+        _NULL_TRANSLATIONS = gettext.NullTranslations()
+    return _NULL_TRANSLATIONS
 
 
 def activate(
     locale: str | None, path: str | os.PathLike[str] | None = None
-) -> gettext_module.NullTranslations:
+) -> NullTranslations:
     """Activate internationalisation.
 
     Set `locale` as current locale. Search for locale in directory `path`.
 
+    The locale is activated for the calling thread or asyncio task only. It is safe
+    to call from many threads at once: each catalog is loaded a single time, however
+    many threads ask for it. To activate a locale for a block of code, use
+    ``locale()``.
+
     Args:
         locale (str | None): Language name, e.g. `en_GB`. If `None`, defaults to no
             translation. Similar to calling ``deactivate()``.
@@ -72,10 +151,116 @@ def activate(
     Raises:
         FileNotFoundError: If humanize cannot find the locale folder.
     """
+    locale, translation = _find_translation(locale, path)
+    _CURRENT.set(locale)
+    return translation
+
+
+@contextmanager
+def locale(
+    locale: str | None, path: str | os.PathLike[str] | None = None
+) -> Iterator[NullTranslations]:
+    """Activate internationalisation inside a `with` block.
+
+    The previous locale is restored on exit. As with ``activate()``, this only
+    affects the calling thread or asyncio task, so concurrent tasks can each format
+    in their own locale.
+
+    Examples:
+        ```pycon
+        >>> import humanize
+        >>> with locale("fr_FR"):
+        ...     humanize.naturaldelta(3)
+        '3 secondes'
+        >>> humanize.naturaldelta(3)
+        '3 seconds'
+
+        ```
+
+    Args:
+        locale (str | None): Language name, e.g. `en_GB`. If `None`, defaults to no
+            translation.
+        path (str | pathlib.Path): Path to search for locales.
+
+    Yields:
+        dict: Translations.
+
+    Raises:
+        FileNotFoundError: If humanize cannot find the locale folder.
+    """
+    locale, translation = _find_translation(locale, path)
+    token = _CURRENT.set(locale)
+    try:
+        yield translation
+    finally:
+        _CURRENT.reset(token)
+
+
+def _find_translation(
+    locale: str | None, path: str | os.PathLike[str] | None
+) -> tuple[str | None, NullTranslations]:
+    """Return the locale to activate for `locale`, and its translation."""
     if locale is None or locale.startswith("en"):
-        _CURRENT.locale = None
-        return _TRANSLATIONS[None]
+        return None, _null_translations()
+
+    return locale, _load_translation(locale, _locale_path(path))
+
+
+def preload(
+    locales: Iterable[str] | None = None,
+    path: str | os.PathLike[str] | None = None,
+) -> list[str]:
+    """Load translations ahead of their first `activate()`.
 
+    Catalogs are decoded in full and kept in module state. Call this before forking
+    worker processes so every worker shares the loaded catalogs, and the first
+    request for a locale does not pay to load it.
+
+    Catalogs stay memory-mapped for the life of the process. Before Python 3.13,
+    each mapping also keeps a file descriptor open on Unix, one per locale, which
+    forked workers inherit.
+
+    Examples:
+        ```pycon
+        >>> preload(["fr_FR", "de_DE"])
+        ['fr_FR', 'de_DE']
+
+        ```
+
+    Args:
+        locales (Iterable[str] | None): Language names, e.g. `["fr_FR", "de_DE"]`.
+            If `None`, loads every locale found in `path`.
+        path (str | pathlib.Path): Path to search for locales.
+
+    Returns:
+        list[str]: The locales loaded, in the order they were loaded.
+
+    Raises:
+        FileNotFoundError: If humanize cannot find the locale folder, or one of
+            `locales`.
+    """
+    import pathlib
+
+    from ._catalog import MappedCatalog
+
+    path = _locale_path(path)
+    if locales is None:
+        mo_files = pathlib.Path(path).glob("*/LC_MESSAGES/humanize.mo")
+        locales = sorted(mo_file.parents[1].name for mo_file in mo_files)
+
+    loaded = []
+    for locale in locales:
+        if locale.startswith("en"):
+            continue
+        catalog = getattr(_load_translation(locale, path), "_catalog", None)
+        if isinstance(catalog, MappedCatalog):
+            catalog.load()
+        loaded.append(locale)
+    return loaded
+
+
+def _locale_path(path: str | os.PathLike[str] | None) -> str | os.PathLike[str]:
+    """Return `path`, or the bundled locale folder if it is `None`."""
     if path is None:
         path = _get_default_locale_path()
 
@@ -85,16 +270,34 @@ def activate(
             "You need to pass the path explicitly."
         )
         raise FileNotFoundError(msg)
-    if locale not in _TRANSLATIONS:
-        translation = gettext_module.translation("humanize", path, [locale])
-        _TRANSLATIONS[locale] = translation
-    _CURRENT.locale = locale
+    return path
+
+
+def _load_translation(locale: str, path: str | os.PathLike[str]) -> NullTranslations:
+    """Return the translation for `locale`, loading it from `path` on first use."""
+    try:
+        return _TRANSLATIONS[locale]
+    except KeyError:
+        pass
+
+    import gettext
+    import threading
+
+    from ._catalog import MappedTranslations
+
+    with _LOAD_LOCKS.setdefault(locale, threading.Lock()):
+        if locale not in _TRANSLATIONS:
+            translation = gettext.translation(
+                "humanize", path, [locale], class_=MappedTranslations
+            )
+            _separator_table(locale)
+            _TRANSLATIONS[locale] = translation
     return _TRANSLATIONS[locale]
 
 
 def deactivate() -> None:
     """Deactivate internationalisation."""
-    _CURRENT.locale = None
+    _CURRENT.set(None)
 
 
 def _gettext(message: str) -> str:
@@ -106,7 +309,12 @@ def _gettext(message: str) -> str:
     Returns:
         str: Translated text.
     """
-    return get_translation().gettext(message)
+    # These three functions are called several times per formatted value: with
+    # no locale active, answer directly rather than through `_IdentityTranslations`.
+    locale = _CURRENT.get()
+    if locale is None:
+        return message
+    return _TRANSLATIONS.get(locale, _IDENTITY).gettext(message)
 
 
 def _pgettext(msgctxt: str, message: str) -> str:
@@ -122,7 +330,10 @@ def _pgettext(msgctxt: str, message: str) -> str:
     Returns:
         str: Translated text.
     """
-    return get_translation().pgettext(msgctxt, message)
+    locale = _CURRENT.get()
+    if locale is None:
+        return message
+    return _TRANSLATIONS.get(locale, _IDENTITY).pgettext(msgctxt, message)
 
 
 def _ngettext(message: str, plural: str, num: int) -> str:
@@ -137,7 +348,10 @@ def _ngettext(message: str, plural: str, num: int) -> str:
     Returns:
         str: Translated text.
     """
-    return get_translation().ngettext(message, plural, num)
+    locale = _CURRENT.get()
+    if locale is None:
+        return message if num == 1 else plural
+    return _TRANSLATIONS.get(locale, _IDENTITY).ngettext(message, plural, num)
 
 
 def _gettext_noop(message: str) -> str:
@@ -179,13 +393,27 @@ def _ngettext_noop(singular: str, plural: str) -> tuple[str, str]:
     return singular, plural
 
 
+def _separator_table(locale: str | None) -> dict[int, int] | None:
+    """Return the table translating "," and "." to the separators of `locale`."""
+    try:
+        return _SEPARATOR_TABLE[locale]
+    except KeyError:
+        pass
+    thousands_sep = _THOUSANDS_SEPARATOR.get(locale, ",")
+    decimal_sep = _DECIMAL_SEPARATOR.get(locale, ".")
+    table = None
+    if thousands_sep != "," or decimal_sep != ".":
+        table = str.maketrans(",.", thousands_sep + decimal_sep)
+    return _SEPARATOR_TABLE.setdefault(locale, table)
+
+
 def thousands_separator() -> str:
     """Return the thousands separator for a locale, default to comma.
 
     Returns:
          str: Thousands separator.
     """
-    return _THOUSANDS_SEPARATOR.get(getattr(_CURRENT, "locale", None), ",")
+    return _THOUSANDS_SEPARATOR.get(_get_locale(), ",")
 
 
 def decimal_separator() -> str:
@@ -194,4 +422,4 @@ def decimal_separator() -> str:
     Returns:
          str: Decimal separator.
     """
-    return _DECIMAL_SEPARATOR.get(getattr(_CURRENT, "locale", None), ".")
+    return _DECIMAL_SEPARATOR.get(_get_locale(), ".")
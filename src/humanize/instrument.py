@@ -0,0 +1,195 @@
+"""Opt-in statistics on the humanize functions an application calls.
+
+`enable()` replaces each public function of the `humanize` package with a wrapper
+that records its calls, their cumulative and per-call latency, and the fallback
+branches they take. `disable()` puts the original functions back, so nothing is
+measured, and nothing is slowed down, unless instrumentation is on:
+
+```pycon
+>>> import humanize
+>>> from humanize import instrument
+>>> instrument.enable()
+>>> humanize.intcomma(1_000_000), humanize.intcomma("lots")
+('1,000,000', 'lots')
+>>> stats = instrument.snapshot()["intcomma"]
+>>> stats["calls"], stats["fallbacks"]
+(2, {'str': 1})
+>>> instrument.disable()
+>>> instrument.reset()
+
+```
+
+Only calls made through the `humanize` package are recorded, such as
+`humanize.intcomma(...)`, or names imported from it after `enable()`. Calls between
+humanize functions are attributed to the outermost one.
+
+The fallback branches are:
+
+- `str`: the value could not be formatted and was returned as `str(value)`.
+- `not_finite`: the value was NaN or infinite.
+- `scientific`: `metric` was out of the range of SI prefixes and used `scientific`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextvars import ContextVar
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+__all__ = ["disable", "enable", "is_enabled", "reset", "snapshot"]
+
+# Upper bounds in seconds of the latency histogram buckets
+BUCKETS = (
+    1e-6,
+    2e-6,
+    5e-6,
+    1e-5,
+    2e-5,
+    5e-5,
+    1e-4,
+    2e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    math.inf,
+)
+
+_LOCK = threading.Lock()
+_CURRENT: ContextVar[str | None] = ContextVar("humanize_instrumented", default=None)
+# Mapping of function name to its original, while enabled
+_ORIGINALS: dict[str, Callable[..., Any]] = {}
+
+
+class _Stats:
+    """What has been recorded for one function."""
+
+    __slots__ = ("calls", "fallbacks", "histogram", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.histogram = [0] * len(BUCKETS)
+        self.fallbacks: dict[str, int] = {}
+
+
+_STATS: dict[str, _Stats] = {}
+
+
+def enable() -> None:
+    """Start recording calls to the public functions of `humanize`.
+
+    Calling this while instrumentation is enabled does nothing.
+    """
+    import inspect
+
+    import humanize
+    from humanize import number
+
+    with _LOCK:
+        if _ORIGINALS:
+            return
+        for name in humanize.__all__:
+            func = getattr(humanize, name)
+            if inspect.isfunction(func):
+                _ORIGINALS[name] = func
+                _STATS.setdefault(name, _Stats())
+                setattr(humanize, name, _instrumented(name, func))
+        number._on_fallback = _record_fallback
+
+
+def disable() -> None:
+    """Stop recording and restore the original functions.
+
+    The statistics recorded so far are kept until `reset()`.
+    """
+    import humanize
+    from humanize import number
+
+    with _LOCK:
+        number._on_fallback = None
+        for name, func in _ORIGINALS.items():
+            setattr(humanize, name, func)
+        _ORIGINALS.clear()
+
+
+def is_enabled() -> bool:
+    """Return whether calls are being recorded."""
+    return bool(_ORIGINALS)
+
+
+def reset() -> None:
+    """Forget everything recorded so far."""
+    with _LOCK:
+        for name in list(_STATS):
+            _STATS[name] = _Stats()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return what has been recorded, per function name.
+
+    Only functions that have been called are included. For each one:
+
+    - `calls` (int): Number of calls.
+    - `seconds` (float): Time spent in them in total.
+    - `histogram` (dict[float, int]): Number of calls per latency bucket, keyed by
+      the bucket's upper bound in seconds. The last bound is infinity.
+    - `fallbacks` (dict[str, int]): Number of times each fallback branch was taken.
+
+    Returns:
+        dict: A copy of the statistics, which later calls do not change.
+    """
+    with _LOCK:
+        return {
+            name: {
+                "calls": stats.calls,
+                "seconds": stats.seconds,
+                "histogram": dict(zip(BUCKETS, stats.histogram)),
+                "fallbacks": dict(stats.fallbacks),
+            }
+            for name, stats in sorted(_STATS.items())
+            if stats.calls
+        }
+
+
+def _instrumented(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Return a wrapper of `func` that records its calls under `name`."""
+    import functools
+
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _CURRENT.get() is not None or not _ORIGINALS:
+            # Called by another recorded function, or kept after `disable()`
+            return func(*args, **kwargs)
+        token = _CURRENT.set(name)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            _CURRENT.reset(token)
+            with _LOCK:
+                stats = _STATS[name]
+                stats.calls += 1
+                stats.seconds += elapsed
+                stats.histogram[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+    return wrapper
+
+
+def _record_fallback(branch: str) -> None:
+    """Count a fallback branch taken by the function being recorded."""
+    name = _CURRENT.get()
+    if name is None:
+        return
+    with _LOCK:
+        fallbacks = _STATS[name].fallbacks
+        fallbacks[branch] = fallbacks.get(branch, 0) + 1
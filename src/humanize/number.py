@@ -5,19 +5,30 @@ from __future__ import annotations
 __lazy_modules__ = {"bisect"}
 
 import bisect
-
+import sys
+from functools import lru_cache
+
+from .i18n import (
+    _current_translation,
+    _get_locale,
+    _ngettext,
+    _separator_table,
+    decimal_separator,
+    thousands_separator,
+)
 from .i18n import _gettext as _
-from .i18n import _ngettext, decimal_separator, thousands_separator
 from .i18n import _ngettext_noop as NS_
-from .i18n import _pgettext as P_
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from typing import TypeAlias
+    from collections.abc import Callable, Iterable
+    from typing import Any, TypeAlias
 
     # This type can be better defined by typing.SupportsFloat
     # but that's a Python 3.8 only typing option.
     NumberOrString: TypeAlias = float | str
+    # Precision, 10**precision and a (multiplier, divisor, carry) step per power
+    _IntwordTable: TypeAlias = tuple[int, int, tuple[tuple[int, int, int], ...]]
 
 
 _SUPERSCRIPT_MAP = {
@@ -50,10 +61,24 @@ _APNUMBER_WORDS = (
 )
 
 
+# Called with the name of each fallback branch taken, while `humanize.instrument`
+# is enabled
+_on_fallback: Callable[[str], None] | None = None
+
+
+def _str_fallback(value: Any) -> str:
+    """Return `str(value)`, for a value that cannot be formatted."""
+    if _on_fallback is not None:
+        _on_fallback("str")
+    return str(value)
+
+
 def _format_not_finite(value: float) -> str:
     """Utility function to handle infinite and nan cases."""
     import math
 
+    if _on_fallback is not None:
+        _on_fallback("not_finite")
     if math.isnan(value):
         return "NaN"
     if math.isinf(value) and value < 0:
@@ -100,17 +125,67 @@ def ordinal(value: NumberOrString, gender: str = "male") -> str:
     Returns:
         str: Ordinal string.
     """
-    import math
+    return _ordinal(value, _ordinal_suffixes(gender))
 
-    try:
-        if not math.isfinite(float(value)):
-            return _format_not_finite(float(value))
-        value = int(value)
-    except (TypeError, ValueError):
-        return str(value)
-    gender = "male" if gender == "male" else "female"
+
+def ordinal_many(values: Iterable[NumberOrString], gender: str = "male") -> list[str]:
+    """Convert many integers to their ordinals.
+
+    The result is the same as calling `ordinal` on each element, but the suffixes of
+    the current locale are looked up once for all of them.
+
+    Examples:
+        ```pycon
+        >>> ordinal_many([1, 2, "3", 11, 22, None])
+        ['1st', '2nd', '3rd', '11th', '22nd', 'None']
+
+        ```
+
+    Args:
+        values (iterable of int, str, float): Integers to convert.
+        gender (str): Gender for translations. Accepts either "male" or "female".
+
+    Returns:
+        list[str]: Ordinal strings, in order.
+    """
+    suffixes = _ordinal_suffixes(gender)
+    array = _numeric_array(values)
+    if array is not None:
+        values = array.tolist()
+    return [_ordinal(value, suffixes) for value in values]
+
+
+def _ordinal(value: NumberOrString, suffixes: tuple[str, ...]) -> str:
+    """Implement `ordinal` with the suffix of each last digit passed in."""
+    if type(value) is not int:
+        import math
+
+        try:
+            if not math.isfinite(float(value)):
+                return _format_not_finite(float(value))
+            value = int(value)
+        except (TypeError, ValueError):
+            return _str_fallback(value)
     digit = 0 if value % 100 in (11, 12, 13) else value % 10
-    return f"{value}{P_(f'{digit} ({gender})', _ORDINAL_SUFFIXES[digit])}"
+    return f"{value}{suffixes[digit]}"
+
+
+# Mapping of (translation, gender) to the translated suffix of each last digit
+_ORDINAL_TABLES: dict[tuple[Any, str], tuple[str, ...]] = {}
+
+
+def _ordinal_suffixes(gender: str) -> tuple[str, ...]:
+    """Return the ordinal suffixes of the active translation for `gender`."""
+    key = (_current_translation(), "male" if gender == "male" else "female")
+    try:
+        return _ORDINAL_TABLES[key]
+    except KeyError:
+        translation, gender = key
+        suffixes = tuple(
+            translation.pgettext(f"{digit} ({gender})", suffix)
+            for digit, suffix in enumerate(_ORDINAL_SUFFIXES)
+        )
+        return _ORDINAL_TABLES.setdefault(key, suffixes)
 
 
 def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
@@ -147,10 +222,37 @@ def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
     Returns:
         str: String containing commas every three digits.
     """
-    import math
-
     thousands_sep = thousands_separator()
     decimal_sep = decimal_separator()
+    return _intcomma(
+        value,
+        ndigits,
+        thousands_sep,
+        decimal_sep,
+        _separator_table(_get_locale()),
+    )
+
+
+def _intcomma(
+    value: NumberOrString,
+    ndigits: int | None,
+    thousands_sep: str,
+    decimal_sep: str,
+    table: dict[int, int] | None,
+) -> str:
+    """Implement `intcomma` with the locale separators passed in."""
+    # Integers and strings of digits take a fast path that never converts to float,
+    # which also keeps arbitrarily large integers exact.
+    if ndigits is None or ndigits >= 0:
+        if type(value) is int:
+            return _intcomma_int(value, ndigits, table)
+        if isinstance(value, str):
+            digits = value[1:] if value.startswith("-") else value
+            if digits.isdecimal():
+                return _intcomma_int(int(value), ndigits, table)
+
+    import math
+
     try:
         if isinstance(value, str):
             value = value.replace(thousands_sep, "").replace(decimal_sep, ".")
@@ -165,14 +267,24 @@ def intcomma(value: NumberOrString, ndigits: int | None = None) -> str:
                 return _format_not_finite(float(value))
             float(value)
     except (TypeError, ValueError):
-        return str(value)
+        return _str_fallback(value)
 
     if ndigits is not None:
         result = f"{value:,.{ndigits}f}"
     else:
         result = f"{value:,}"
-    if thousands_sep != "," or decimal_sep != ".":
-        result = result.translate(str.maketrans(",.", thousands_sep + decimal_sep))
+    if table is not None:
+        result = result.translate(table)
+    return result
+
+
+def _intcomma_int(value: int, ndigits: int | None, table: dict[int, int] | None) -> str:
+    """Format an `int` for `intcomma` without converting it to float."""
+    result = f"{value:,}"
+    if ndigits:
+        result += "." + "0" * ndigits
+    if table is not None:
+        result = result.translate(table)
     return result
 
 
@@ -198,7 +310,8 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
 
     Works best for numbers over 1 million. For example, 1_000_000 becomes "1.0 million",
     1_200_000 becomes "1.2 million" and "1_200_000_000" becomes "1.2 billion". Supports
-    up to decillion (33 digits) and googol (100 digits).
+    up to decillion (33 digits) and googol (100 digits). Ints are scaled exactly for
+    "%.Nf" formats.
 
     Examples:
         ```pycon
@@ -228,14 +341,25 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
         str: Friendly text representation as a string, unless the value passed could not
             be coaxed into an `int`.
     """
-    import math
+    return _intword(value, format, decimal_separator(), _ngettext)
 
-    try:
-        if not math.isfinite(float(value)):
-            return _format_not_finite(float(value))
-        value = int(value)
-    except (TypeError, ValueError):
-        return str(value)
+
+def _intword(
+    value: NumberOrString,
+    format: str,
+    decimal_sep: str,
+    ngettext: Callable[[str, str, int], str],
+) -> str:
+    """Implement `intword` with the decimal separator and `ngettext` passed in."""
+    if type(value) is not int:
+        import math
+
+        try:
+            if not math.isfinite(float(value)):
+                return _format_not_finite(float(value))
+            value = int(value)
+        except (TypeError, ValueError):
+            return _str_fallback(value)
 
     if value < 0:
         value *= -1
@@ -246,27 +370,216 @@ def intword(value: NumberOrString, format: str = "%.1f") -> str:
     if value < powers[0]:
         return f"{negative_prefix}{value}"
 
-    ordinal = bisect.bisect_right(powers, value)
-    largest_ordinal = ordinal == len(powers)
-
     # Consider the biggest power of 10 that is smaller than value
-    ordinal -= 1
+    ordinal = bisect.bisect_right(powers, value) - 1
+    return _intword_scaled(
+        value, ordinal, negative_prefix, format, decimal_sep, ngettext
+    )
+
+
+def _intword_scaled(
+    value: int,
+    ordinal: int,
+    negative_prefix: str,
+    format: str,
+    decimal_sep: str,
+    ngettext: Callable[[str, str, int], str],
+) -> str:
+    """Render a positive `value` of at least `powers[ordinal]` for `intword`."""
+    # One lookup: another thread may clear the cache between a check and an index
+    try:
+        table = _INTWORD_TABLES[format]
+    except KeyError:
+        table = _intword_table(format)
+    if table is None:
+        return _intword_float(
+            value, ordinal, negative_prefix, format, decimal_sep, ngettext
+        )
+
+    # Round value / power to the format's precision
+    precision, scale, steps = table
+    multiplier, divisor, carry = steps[ordinal]
+    scaled, remainder = divmod(value * multiplier, divisor)
+    remainder *= 2
+    if remainder > divisor:
+        scaled += 1
+    elif remainder == divisor and _rounds_up(value, ordinal, scaled, scale):
+        scaled += 1
+    if scaled == carry:
+        # After rounding, we end up just at the next power
+        ordinal += 1
+        scaled = scale
+
+    singular, plural = human_powers[ordinal]
+    unit = ngettext(singular, plural, -(-scaled // scale))
+    if precision:
+        # value >= power, so there is at least one digit before the separator
+        digits = str(scaled)
+        return (
+            f"{negative_prefix}{digits[:-precision]}{decimal_sep}"
+            f"{digits[-precision:]} {unit}"
+        )
+    return f"{negative_prefix}{scaled} {unit}"
+
+
+def _rounds_up(value: int, ordinal: int, scaled: int, scale: int) -> bool:
+    """Return whether "%.Nf" rounds the float of value / power up from a half.
+
+    value / power is exactly halfway between scaled / scale and the next step. Its
+    float is usually a little above or below, which decides as it always has:
+    1_050_000 is "1.1 million" and 1_150_000 is "1.1 million" too. Halves that are
+    exact in binary round to even, and so do quotients beyond float range.
+    """
+    try:
+        numerator, denominator = (value / powers[ordinal]).as_integer_ratio()
+    except OverflowError:
+        return bool(scaled & 1)
+    # Compare the float with the half, (2 * scaled + 1) / (2 * scale)
+    difference = numerator * 2 * scale - (2 * scaled + 1) * denominator
+    return difference > 0 or (difference == 0 and bool(scaled & 1))
+
+
+# Mapping of each `intword` format seen to its rounding table, or None if it is not
+# a plain "%.Nf" format
+_INTWORD_TABLES: dict[str, _IntwordTable | None] = {}
+_MAX_INTWORD_TABLES = 64
+
+
+def _intword_table(format: str) -> _IntwordTable | None:
+    """Precompute how `intword` scales and rounds an int for a "%.Nf" format.
+
+    For each power, the value times `multiplier` divided by `divisor` is the number
+    to show times `10**precision`, and `carry` is that number when it rounds up to
+    the next power. Other formats get None and are rendered through float.
+    """
+    body = format[1:-1] if format[:1] == "%" and format[-1:] == "f" else ""
+    flags, dot, digits = body.partition(".")
+    if flags not in ("", "0") or not dot or not (digits.isascii() and digits.isdigit()):
+        table = None
+    else:
+        precision = int(digits)
+        scale = 10**precision
+        steps = []
+        for ordinal, power in enumerate(powers):
+            multiplier, divisor = (
+                (scale // power, 1) if scale >= power else (1, power // scale)
+            )
+            carry = (
+                powers[ordinal + 1] // power * scale if ordinal + 1 < len(powers) else 0
+            )
+            steps.append((multiplier, divisor, carry))
+        table = (precision, scale, tuple(steps))
+
+    if len(_INTWORD_TABLES) >= _MAX_INTWORD_TABLES:
+        _INTWORD_TABLES.clear()
+    _INTWORD_TABLES[format] = table
+    return table
+
+
+def _intword_float(
+    value: int,
+    ordinal: int,
+    negative_prefix: str,
+    format: str,
+    decimal_sep: str,
+    ngettext: Callable[[str, str, int], str],
+) -> str:
+    """Render `intword` through float, for formats other than "%.Nf"."""
+    import math
+
     power = powers[ordinal]
     chopped = value / power
     rounded_value = float(format % chopped)
 
-    if not largest_ordinal and rounded_value * power == powers[ordinal + 1]:
+    if ordinal + 1 < len(powers) and rounded_value * power == powers[ordinal + 1]:
         # After rounding, we end up just at the next power
         ordinal += 1
         rounded_value = 1.0
 
     singular, plural = human_powers[ordinal]
-    unit = _ngettext(singular, plural, math.ceil(rounded_value))
-    decimal_sep = decimal_separator()
+    unit = ngettext(singular, plural, math.ceil(rounded_value))
     number = (format % rounded_value).replace(".", decimal_sep)
     return f"{negative_prefix}{number} {unit}"
 
 
+def intword_many(values: Iterable[NumberOrString], format: str = "%.1f") -> list[str]:
+    """Convert many large integers to a friendly text representation.
+
+    The result is the same as calling `intword` on each element. The locale is looked
+    up once, and each translated power name is resolved once per plural form. When
+    `values` is a 1-D NumPy array of integers, the powers are found for the whole
+    array at once with `searchsorted`.
+
+    Examples:
+        ```pycon
+        >>> intword_many([100, "12400", 1_200_000_000, None])
+        ['100', '12.4 thousand', '1.2 billion', 'None']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Integers to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Returns:
+        list[str]: Friendly text representations, in order.
+    """
+    decimal_sep = decimal_separator()
+    ngettext = _plural_forms_cache(_current_translation())
+
+    array = _numeric_array(values)
+    if array is None or array.dtype.kind not in "iu":
+        if array is not None:
+            values = array.tolist()
+        return [_intword(value, format, decimal_sep, ngettext) for value in values]
+
+    np = sys.modules["numpy"]
+    if array.dtype.kind == "u":
+        magnitudes = array.astype(np.uint64)
+    else:
+        # The magnitude of the smallest int64 only fits in uint64
+        magnitudes = np.abs(array.astype(np.int64)).astype(np.uint64)
+    # NumPy ints are below 10**21, so the powers that fit in uint64 are enough
+    bounds = np.array([power for power in powers if power < 2**64], dtype=np.uint64)
+    ordinals = np.searchsorted(bounds, magnitudes, side="right") - 1
+
+    result: list[str] = []
+    append = result.append
+    for value, ordinal in zip(array.tolist(), ordinals.tolist()):
+        if ordinal < 0:
+            append(str(value))
+        elif value < 0:
+            append(_intword_scaled(-value, ordinal, "-", format, decimal_sep, ngettext))
+        else:
+            append(_intword_scaled(value, ordinal, "", format, decimal_sep, ngettext))
+    return result
+
+
+def _plural_forms_cache(translation: Any) -> Callable[[str, str, int], str]:
+    """Return `translation.ngettext`, calling it once per message and plural form.
+
+    A catalog picks the form from its plural function, and falls back to the
+    message or plural when it lacks a translation, so both make up the key. The
+    plural message is left out of it: it is the same for each message here.
+    """
+    ngettext: Callable[[str, str, int], str] = translation.ngettext
+    plural_index = getattr(translation, "plural", None)
+    if plural_index is None:
+        # Without a catalog, there is nothing to look up
+        return ngettext
+    forms: dict[tuple[str, bool, int], str] = {}
+
+    def cached(message: str, plural: str, num: int) -> str:
+        key = (message, num == 1, plural_index(num))
+        form = forms.get(key)
+        if form is None:
+            form = forms[key] = ngettext(message, plural, num)
+        return form
+
+    return cached
+
+
 def apnumber(value: NumberOrString) -> str:
     """Converts an integer to Associated Press style.
 
@@ -302,7 +615,7 @@ def apnumber(value: NumberOrString) -> str:
             return _format_not_finite(float(value))
         value = int(value)
     except (TypeError, ValueError):
-        return str(value)
+        return _str_fallback(value)
     if not 0 <= value < 10:
         return str(value)
     return _(_APNUMBER_WORDS[value])
@@ -354,13 +667,49 @@ def fractional(value: NumberOrString) -> str:
         if not math.isfinite(number):
             return _format_not_finite(number)
     except (TypeError, ValueError):
-        return str(value)
-    from fractions import Fraction
+        return _str_fallback(value)
+    return _fractional(number)
+
+
+def fractional_many(values: Iterable[NumberOrString]) -> list[str]:
+    """Convert many numbers to fractional numbers.
+
+    The result is the same as calling `fractional` on each element.
+
+    Examples:
+        ```pycon
+        >>> fractional_many([0.5, 1.25, 2, "1.3", None])
+        ['1/2', '1 1/4', '2', '1 3/10', 'None']
+
+        ```
 
+    Args:
+        values (iterable of int, float, str): Numbers to convert.
+
+    Returns:
+        list[str]: Fractional numbers as strings, in order.
+    """
+    array = _numeric_array(values)
+    if array is not None:
+        values = array.tolist()
+    return [fractional(value) for value in values]
+
+
+# Fractions in lowest terms with denominators up to 16, keyed by their float value.
+# Smaller denominators come last, so they win for equal values such as 2/6 and 1/3.
+_COMMON_FRACTIONS = {
+    sign * numerator / denominator: (sign * numerator, denominator)
+    for denominator in range(16, 1, -1)
+    for numerator in range(1, denominator)
+    for sign in (1, -1)
+}
+
+
+@lru_cache(maxsize=1024)
+def _fractional(number: float) -> str:
+    """Implement `fractional` for a finite float, memoized on its exact value."""
     whole_number = int(number)
-    frac = Fraction(number - whole_number).limit_denominator(1000)
-    numerator = frac.numerator
-    denominator = frac.denominator
+    numerator, denominator = _limit_denominator(number - whole_number)
     if whole_number and not numerator and denominator == 1:
         # this means that an integer was passed in
         # (or variants of that integer like 1.0000)
@@ -377,6 +726,25 @@ def fractional(value: NumberOrString) -> str:
     return f"{whole_number:.0f} {abs(numerator):.0f}/{denominator:.0f}"
 
 
+def _limit_denominator(number: float) -> tuple[int, int]:
+    """Return `Fraction(number).limit_denominator(1000)` as (numerator, denominator).
+
+    Dyadic fractions such as 1/2 or 3/8 are exact already, and the floats of the
+    common fractions are looked up, so only other numbers need a `Fraction`.
+    """
+    numerator, denominator = number.as_integer_ratio()
+    if denominator <= 1000:
+        return numerator, denominator
+    common = _COMMON_FRACTIONS.get(number)
+    if common is not None:
+        return common
+
+    from fractions import Fraction
+
+    limited = Fraction(numerator, denominator).limit_denominator(1000)
+    return limited.numerator, limited.denominator
+
+
 def scientific(value: NumberOrString, precision: int = 2) -> str:
     """Return number in string scientific notation z.wq x 10ⁿ.
 
@@ -415,7 +783,7 @@ def scientific(value: NumberOrString, precision: int = 2) -> str:
         if not math.isfinite(value):
             return _format_not_finite(value)
     except (ValueError, TypeError):
-        return str(value)
+        return _str_fallback(value)
     fmt = f"{{:.{int(precision)}e}}"
     n = fmt.format(value)
     part1, part2 = n.split("e")
@@ -424,6 +792,57 @@ def scientific(value: NumberOrString, precision: int = 2) -> str:
     return part1 + " x 10" + str(int(part2)).translate(_SUPERSCRIPT_TRANS)
 
 
+def scientific_many(values: Iterable[NumberOrString], precision: int = 2) -> list[str]:
+    """Return many numbers in string scientific notation z.wq x 10ⁿ.
+
+    The result is the same as calling `scientific` on each element, but the format
+    specification is built once and each distinct exponent is converted to
+    superscript once. A 1-D NumPy array of numbers is converted to Python numbers in
+    bulk first.
+
+    Examples:
+        ```pycon
+        >>> scientific_many([0.3, 500, "20000", "foo"])
+        ['3.00 x 10⁻¹', '5.00 x 10²', '2.00 x 10⁴', 'foo']
+
+        ```
+
+    Args:
+        values (iterable of int, float, str): Input numbers.
+        precision (int): Number of decimal for first part of the number.
+
+    Returns:
+        list[str]: Numbers in scientific notation z.wq x 10ⁿ, in order.
+    """
+    import math
+
+    spec = f".{int(precision)}e"
+    powers_of_ten: dict[str, str] = {}
+
+    array = _numeric_array(values)
+    if array is not None:
+        values = array.tolist()
+
+    result: list[str] = []
+    append = result.append
+    for value in values:
+        try:
+            number = float(value)
+        except (ValueError, TypeError):
+            append(_str_fallback(value))
+            continue
+        if not math.isfinite(number):
+            append(_format_not_finite(number))
+            continue
+        part1, part2 = format(number, spec).split("e")
+        power = powers_of_ten.get(part2)
+        if power is None:
+            power = " x 10" + str(int(part2)).translate(_SUPERSCRIPT_TRANS)
+            powers_of_ten[part2] = power
+        append(part1 + power)
+    return result
+
+
 def clamp(
     value: float,
     format: str = "{:}",
@@ -543,6 +962,8 @@ def metric(value: float, unit: str = "", precision: int = 3) -> str:
     exponent = int(math.floor(math.log10(abs(value)))) if value != 0 else 0
 
     if exponent >= 33 or exponent < -30:
+        if _on_fallback is not None:
+            _on_fallback("scientific")
         return scientific(value, precision - 1) + unit
 
     old_bucket = exponent // 3 * 3
@@ -567,3 +988,185 @@ def metric(value: float, unit: str = "", precision: int = 3) -> str:
         space = " "
 
     return f"{value_}{space}{ordinal_}{unit}"
+
+
+def _numeric_array(values: object) -> Any:
+    """Return `values` if it is a 1-D NumPy array of numbers, otherwise `None`.
+
+    NumPy is never imported here: if `values` is an array, the caller already has.
+    """
+    np = sys.modules.get("numpy")
+    if (
+        np is None
+        or not isinstance(values, np.ndarray)
+        or values.ndim != 1
+        or values.dtype.kind not in "fiu"
+    ):
+        return None
+    return values
+
+
+# Divisors that `metric` uses for each exponent bucket, as Python computes them
+_METRIC_SCALES = {bucket: float(10**bucket) for bucket in range(-30, 33, 3)}
+
+
+def metric_many(
+    values: Iterable[float], unit: str = "", precision: int = 3
+) -> list[str]:
+    """Return many values with a metric SI unit-prefix appended.
+
+    The result is the same as calling `metric` on each element. When `values` is a
+    1-D NumPy array of numbers, the exponents, SI prefix buckets and scaled values
+    are computed for the whole array at once, and only the final strings are built
+    one by one. NumPy is optional (`pip install humanize[numpy]`); any other
+    iterable is formatted with a plain loop.
+
+    Examples:
+        ```pycon
+        >>> metric_many([1500, 2e8, 220e-6], "V")
+        ['1.50 kV', '200 MV', '220 μV']
+
+        ```
+
+    Args:
+        values (iterable of int, float): Input numbers.
+        unit (str): Optional base unit.
+        precision (int): The number of digits the output should contain.
+
+    Returns:
+        list[str]: The values with SI prefixes, in order.
+    """
+    array = _numeric_array(values)
+    if array is None:
+        return [metric(value, unit, precision) for value in values]
+
+    import math
+
+    np = sys.modules["numpy"]
+    integers = array if array.dtype.kind in "iu" else None
+    array = array.astype(np.float64)
+    magnitudes = np.abs(array)
+    finite = np.isfinite(array)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.where(finite & (array != 0), np.log10(magnitudes), 0.0)
+    exponents = np.floor(logs).astype(np.int64)
+    # NumPy's log10 can differ from math.log10 in the last bit, which only matters
+    # when the floor is near an integer: redo those with math.log10 like `metric`.
+    near_integers = finite & (array != 0) & (np.abs(logs - np.rint(logs)) < 1e-9)
+    for i in np.flatnonzero(near_integers).tolist():
+        exponents[i] = math.floor(math.log10(magnitudes[i]))
+
+    in_range = finite & (exponents < 33) & (exponents >= -30)
+    buckets = np.where(in_range, exponents // 3 * 3, 0)
+    scales = np.array([_METRIC_SCALES[bucket] for bucket in range(-30, 33, 3)])
+    scaled = array / scales[(buckets + 30) // 3]
+    digits = np.maximum(0, precision - exponents % 3 - 1).astype(np.int64)
+
+    scaled_ = scaled.tolist()
+    exponents_ = exponents.tolist()
+    digits_ = digits.tolist()
+    # Rounding can carry a scaled value to 1000, which moves it up one bucket
+    carries = in_range & (exponents < 30) & (np.abs(scaled) >= 999)
+    for i in np.flatnonzero(carries).tolist():
+        value = scaled_[i]
+        if round(abs(value), digits_[i]) >= 1000:
+            exponent = exponents_[i] + 3 - exponents_[i] % 3
+            scaled_[i] = value / 1000
+            exponents_[i] = exponent
+            digits_[i] = int(max(0, precision - exponent % 3 - 1))
+
+    suffixes = {}
+    for exponent in range(-30, 33):
+        if exponent >= 3:
+            ordinal_ = "kMGTPEZYRQ"[exponent // 3 - 1]
+        elif exponent < 0:
+            ordinal_ = "mμnpfazyrq"[(-exponent - 1) // 3]
+        else:
+            ordinal_ = ""
+        space = "" if not (unit or ordinal_) or unit in ("°", "′", "″") else " "
+        suffixes[exponent] = f"{space}{ordinal_}{unit}"
+    specs = [f".{digit}f" for digit in range(max(digits_, default=0) + 1)]
+
+    result: list[str] = []
+    append = result.append
+    for value, exponent, digit, ok, original in zip(
+        scaled_, exponents_, digits_, in_range.tolist(), array.tolist()
+    ):
+        if ok:
+            append(format(value, specs[digit]) + suffixes[exponent])
+        elif not math.isfinite(original):
+            append(_format_not_finite(original))
+        else:
+            if _on_fallback is not None:
+                _on_fallback("scientific")
+            append(scientific(original, precision - 1) + unit)
+    if integers is not None:
+        # float64 rounds integers above 2**53, but `metric` divides the exact value
+        inexact = (integers > 2**53) | (integers < -(2**53))
+        for i in np.flatnonzero(inexact).tolist():
+            result[i] = metric(int(integers[i]), unit, precision)
+    return result
+
+
+class NumberFormatter:
+    """Format numbers with fixed options, in the locale active at creation.
+
+    `intcomma` and `intword` look up the current locale's separators and translations
+    on every call. A `NumberFormatter` looks them up once, when it is created, so it
+    is cheaper to reuse for many values. Activating another locale later does not
+    change the output of an existing formatter.
+
+    Examples:
+        ```pycon
+        >>> fmt = NumberFormatter()
+        >>> fmt(1_000_000)
+        '1,000,000'
+        >>> fmt.format_many([100, "1000", 1_234_567.25])
+        ['100', '1,000', '1,234,567.25']
+        >>> fmt.intword(1_200_000)
+        '1.2 million'
+        >>> fmt.metric(1500, "V")
+        '1.50 kV'
+
+        ```
+    """
+
+    def __init__(self, ndigits: int | None = None, format: str = "%.1f") -> None:
+        """Bind the options and the current locale.
+
+        Args:
+            ndigits (int, None): Digits of precision for rounding after the decimal
+                point, as for `intcomma`.
+            format (str): Format of the number portion, as for `intword`.
+        """
+        self.ndigits = ndigits
+        self.format = format
+        self._thousands_sep = thousands_separator()
+        self._decimal_sep = decimal_separator()
+        self._table = _separator_table(_get_locale())
+        self._ngettext = _current_translation().ngettext
+
+    def __call__(self, value: NumberOrString) -> str:
+        """Same as `intcomma(value, ndigits)`."""
+        return _intcomma(
+            value, self.ndigits, self._thousands_sep, self._decimal_sep, self._table
+        )
+
+    def format_many(self, values: Iterable[NumberOrString]) -> list[str]:
+        """Same as calling the formatter on each value."""
+        ndigits = self.ndigits
+        thousands_sep = self._thousands_sep
+        decimal_sep = self._decimal_sep
+        table = self._table
+        return [
+            _intcomma(value, ndigits, thousands_sep, decimal_sep, table)
+            for value in values
+        ]
+
+    def intword(self, value: NumberOrString) -> str:
+        """Same as `intword(value, format)`."""
+        return _intword(value, self.format, self._decimal_sep, self._ngettext)
+
+    def metric(self, value: float, unit: str = "", precision: int = 3) -> str:
+        """Same as `metric(value, unit, precision)`."""
+        return metric(value, unit, precision)
@@ -0,0 +1,238 @@
+"""Pandas accessor for humanizing whole columns.
+
+Importing this module registers a `humanize` accessor on pandas `Series` and
+`DataFrame` objects. It is not imported by `import humanize`, so pandas is only
+loaded by code that asks for it:
+
+```pycon
+>>> import pandas as pd
+>>> import humanize.pandas
+>>> pd.Series([300, 3_000_000]).humanize.naturalsize().tolist()
+['300 Bytes', '3.0 MB']
+
+```
+
+Each method gives the same strings as mapping the scalar function over the values,
+except that missing values stay missing. Nullable columns such as `Int64` are
+formatted from their present values, so integers stay exact. `naturalsize` picks
+the suffix of each value with NumPy on the whole column and `naturaldelta` formats
+each distinct output once; `intcomma` formats one value at a time.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from .filesize import SizeFormatter
+from .number import NumberFormatter
+from .time import DeltaFormatter
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+__all__ = ["HumanizeDataFrameAccessor", "HumanizeSeriesAccessor"]
+
+
+@pd.api.extensions.register_series_accessor("humanize")
+class HumanizeSeriesAccessor:
+    """Humanize the values of a `Series`, available as `series.humanize`.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> import pandas as pd
+        >>> import humanize.pandas
+        >>> pd.Series([1_000_000, 1_234]).humanize.intcomma().tolist()
+        ['1,000,000', '1,234']
+        >>> deltas = pd.Series([dt.timedelta(hours=3), dt.timedelta(days=-400)])
+        >>> deltas.humanize.naturaldelta().tolist()
+        ['3 hours', '1 year, 1 month']
+
+        ```
+    """
+
+    def __init__(self, series: pd.Series[Any]) -> None:
+        """Wrap `series`; pandas calls this on `series.humanize`."""
+        self._series = series
+
+    def intcomma(self, ndigits: int | None = None) -> pd.Series[str]:
+        """Apply `humanize.intcomma` to each value.
+
+        Args:
+            ndigits (int, None): Digits of precision for rounding after the decimal
+                point.
+
+        Returns:
+            Series: Strings containing commas every three digits.
+        """
+        missing, values = self._present()
+        return self._result(
+            NumberFormatter(ndigits).format_many(values.tolist()), missing
+        )
+
+    def naturalsize(
+        self, binary: bool = False, gnu: bool = False, format: str = "%.1f"
+    ) -> pd.Series[str]:
+        """Apply `humanize.naturalsize` to each value.
+
+        Args:
+            binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+                2<sup>10</sup> instead of 10<sup>3</sup>.
+            gnu (bool): If `True`, the binary argument is ignored and GNU-style
+                (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+            format (str): Custom formatter.
+
+        Returns:
+            Series: Human readable file sizes.
+        """
+        import numpy as np
+
+        missing, values = self._present()
+        if values.dtype.kind not in "fiu":
+            values = values.astype(np.float64)
+        formatter = SizeFormatter(binary, gnu, format)
+        return self._result(formatter.format_many(values), missing)
+
+    def naturaldelta(
+        self, months: bool = True, minimum_unit: str = "seconds"
+    ) -> pd.Series[str]:
+        """Apply `humanize.naturaldelta` to each value.
+
+        Args:
+            months (bool): If `True`, then a number of months (based on 30.5 days) will
+                be used for fuzziness between years.
+            minimum_unit (str): The lowest unit that can be used.
+
+        Returns:
+            Series: Natural representations of the time differences.
+
+        Raises:
+            ValueError: If `minimum_unit` is not supported.
+        """
+        formatter = DeltaFormatter(months, minimum_unit)
+        missing, values = self._present()
+
+        keys = _naturaldelta_keys(values)
+        if keys is None:
+            # Render each distinct value once
+            codes, uniques = pd.factorize(values)
+            texts = [formatter(value) for value in uniques]
+        else:
+            codes, uniques = pd.factorize(keys)
+            texts = [formatter(_naturaldelta_key_delta(key)) for key in uniques]
+        return self._result([texts[code] for code in codes.tolist()], missing)
+
+    def _present(self) -> tuple[Any, Any]:
+        """Return a mask of the missing values, and the other values as an array.
+
+        The values are selected before converting to NumPy: a nullable column with
+        missing values would otherwise become float64 or object.
+        """
+        missing = self._series.isna().to_numpy()
+        return missing, self._series[~missing].to_numpy()
+
+    def _result(self, texts: list[str], missing: Any) -> pd.Series[str]:
+        """Return `texts` as a Series like this one, with missing values put back."""
+        result: list[str | None] = list(texts)
+        if missing.any():
+            it = iter(texts)
+            result = [
+                None if is_missing else next(it) for is_missing in missing.tolist()
+            ]
+        return pd.Series(result, index=self._series.index, name=self._series.name)
+
+
+@pd.api.extensions.register_dataframe_accessor("humanize")
+class HumanizeDataFrameAccessor:
+    """Humanize every column of a `DataFrame`, available as `frame.humanize`.
+
+    Each method applies the `Series` method of the same name to every column.
+
+    Examples:
+        ```pycon
+        >>> import pandas as pd
+        >>> import humanize.pandas
+        >>> frame = pd.DataFrame({"rx": [1_000, 2_500_000], "tx": [10, 4_000]})
+        >>> frame.humanize.naturalsize(binary=True)
+                   rx        tx
+        0  1000 Bytes  10 Bytes
+        1     2.4 MiB   3.9 KiB
+
+        ```
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        """Wrap `frame`; pandas calls this on `frame.humanize`."""
+        self._frame = frame
+
+    def intcomma(self, ndigits: int | None = None) -> pd.DataFrame:
+        """Apply `humanize.intcomma` to each value of each column."""
+        return self._apply(lambda column: column.intcomma(ndigits))
+
+    def naturalsize(
+        self, binary: bool = False, gnu: bool = False, format: str = "%.1f"
+    ) -> pd.DataFrame:
+        """Apply `humanize.naturalsize` to each value of each column."""
+        return self._apply(lambda column: column.naturalsize(binary, gnu, format))
+
+    def naturaldelta(
+        self, months: bool = True, minimum_unit: str = "seconds"
+    ) -> pd.DataFrame:
+        """Apply `humanize.naturaldelta` to each value of each column."""
+        return self._apply(lambda column: column.naturaldelta(months, minimum_unit))
+
+    def _apply(
+        self, method: Callable[[HumanizeSeriesAccessor], pd.Series[str]]
+    ) -> pd.DataFrame:
+        """Return a frame like this one with `method` applied to every column."""
+        if self._frame.shape[1] == 0:
+            return self._frame.copy()
+        columns = [
+            method(HumanizeSeriesAccessor(column)) for _, column in self._frame.items()
+        ]
+        result = pd.concat(columns, axis=1)
+        result.columns = self._frame.columns
+        return result
+
+
+def _naturaldelta_keys(values: Any) -> Any:
+    """Return a key per value that determines its `naturaldelta`, or `None`.
+
+    `naturaldelta` only looks at the days of deltas of a day or more, at the seconds
+    of shorter deltas, and at the microseconds of deltas under a second. Keys are
+    `-days`, `seconds * 1_000_000` and `microseconds` respectively. Only timedelta
+    and integer arrays are keyed, other values are rendered one distinct value at
+    a time.
+    """
+    import numpy as np
+
+    kind = values.dtype.kind
+    if kind == "m":
+        # Like `abs()` then `.microseconds` on each `pandas.Timedelta`
+        total = np.abs(values).astype("m8[us]").astype(np.int64)
+        seconds, microseconds = np.divmod(total, 1_000_000)
+    elif kind in "iu":
+        # Beyond this, the float seconds and day count lose precision or overflow
+        if len(values) and (values.max() >= 2**46 or values.min() <= -(2**46)):
+            return None
+        seconds = np.abs(values.astype(np.int64))
+        microseconds = np.zeros_like(seconds)
+    else:
+        return None
+
+    days, seconds = np.divmod(seconds, 86_400)
+    return np.where(
+        days > 0, -days, np.where(seconds > 0, seconds * 1_000_000, microseconds)
+    )
+
+
+def _naturaldelta_key_delta(key: int) -> Any:
+    """Return a timedelta with the `naturaldelta` of `key`."""
+    import datetime as dt
+
+    key = int(key)
+    if key < 0:
+        return dt.timedelta(days=-key)
+    return dt.timedelta(microseconds=key)
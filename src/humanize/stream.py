@@ -0,0 +1,174 @@
+"""Lazily humanize the values of an iterable.
+
+Each function takes an iterable and returns an iterator yielding one string per
+value, formatted as it is consumed. Memory use does not grow with the input, so the
+input can be larger than memory, such as the rows of a huge file. Options, the
+current locale and, for `naturaltime`, the current time are bound when the iterator
+is created, not per value.
+
+```pycon
+>>> from humanize import stream
+>>> sizes = stream.naturalsize(iter([300, 3_000, 3_000_000]))
+>>> next(sizes)
+'300 Bytes'
+>>> list(sizes)
+['3.0 kB', '3.0 MB']
+
+```
+"""
+
+from __future__ import annotations
+
+__lazy_modules__ = {"humanize.filesize", "humanize.number", "humanize.time"}
+
+from .filesize import SizeFormatter
+from .number import NumberFormatter
+from .time import (
+    DeltaFormatter,
+    PreciseDeltaFormatter,
+    _convert_aware_datetime,
+    _naturaltimes,
+    _now,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Iterable, Iterator
+
+    from .number import NumberOrString
+
+__all__ = [
+    "intcomma",
+    "intword",
+    "naturaldelta",
+    "naturalsize",
+    "naturaltime",
+    "precisedelta",
+]
+
+
+def intcomma(
+    values: Iterable[NumberOrString], ndigits: int | None = None
+) -> Iterator[str]:
+    """Lazily apply `humanize.intcomma` to each value.
+
+    Args:
+        values (iterable of int, float or str): Numbers to convert.
+        ndigits (int, None): Digits of precision for rounding after the decimal point.
+
+    Returns:
+        Iterator[str]: Strings containing commas every three digits.
+    """
+    return map(NumberFormatter(ndigits), values)
+
+
+def intword(values: Iterable[NumberOrString], format: str = "%.1f") -> Iterator[str]:
+    """Lazily apply `humanize.intword` to each value.
+
+    Args:
+        values (iterable of int, float or str): Numbers to convert.
+        format (str): To change the number of decimal or general format of the number
+            portion.
+
+    Returns:
+        Iterator[str]: Friendly representations of the numbers.
+    """
+    return map(NumberFormatter(format=format).intword, values)
+
+
+def naturalsize(
+    values: Iterable[float | str],
+    binary: bool = False,
+    gnu: bool = False,
+    format: str = "%.1f",
+) -> Iterator[str]:
+    """Lazily apply `humanize.naturalsize` to each value.
+
+    Args:
+        values (iterable of int, float or str): Numbers of bytes.
+        binary (bool): If `True`, uses binary suffixes (KiB, MiB) with base
+            2<sup>10</sup> instead of 10<sup>3</sup>.
+        gnu (bool): If `True`, the binary argument is ignored and GNU-style
+            (`ls -sh` style) prefixes are used (K, M) with the 2**10 definition.
+        format (str): Custom formatter.
+
+    Returns:
+        Iterator[str]: Human readable file sizes.
+    """
+    return map(SizeFormatter(binary, gnu, format), values)
+
+
+def naturaldelta(
+    values: Iterable[dt.timedelta | float],
+    months: bool = True,
+    minimum_unit: str = "seconds",
+) -> Iterator[str]:
+    """Lazily apply `humanize.naturaldelta` to each value.
+
+    Args:
+        values (iterable of datetime.timedelta, int or float): Time differences, or
+            numbers of seconds.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+
+    Returns:
+        Iterator[str]: Natural representations of the time differences.
+
+    Raises:
+        ValueError: If `minimum_unit` is not supported.
+    """
+    return map(DeltaFormatter(months, minimum_unit), values)
+
+
+def naturaltime(
+    values: Iterable[dt.datetime | dt.timedelta | float],
+    future: bool = False,
+    months: bool = True,
+    minimum_unit: str = "seconds",
+    when: dt.datetime | None = None,
+) -> Iterator[str]:
+    """Lazily apply `humanize.naturaltime` to each value, relative to one moment.
+
+    Like `humanize.naturaltime_many`, every value is relative to the same moment:
+    `when`, or the current time when the iterator is created.
+
+    Args:
+        values (iterable of datetime.datetime, datetime.timedelta, int or float):
+            `datetime`s, `timedelta`s, or numbers of seconds.
+        future (bool): Ignored for `datetime`s and `timedelta`s, where the tense is
+            always figured out based on the current time. For integers and floats, the
+            return value will be past tense by default, unless future is `True`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (datetime.datetime): Point in time relative to which _values_ are
+            interpreted.  Defaults to the current time in the local timezone.
+
+    Returns:
+        Iterator[str]: Natural representations of the inputs.
+    """
+    now = _convert_aware_datetime(when) or _now()
+    return _naturaltimes(values, future, months, minimum_unit, now)
+
+
+def precisedelta(
+    values: Iterable[dt.timedelta | float],
+    minimum_unit: str = "seconds",
+    suppress: Iterable[str] = (),
+    format: str = "%0.2f",
+) -> Iterator[str]:
+    """Lazily apply `humanize.precisedelta` to each value.
+
+    Args:
+        values (iterable of datetime.timedelta, int or float): Time differences, or
+            numbers of seconds.
+        minimum_unit (str): The lowest unit that can be used.
+        suppress (Iterable[str]): Units that must not be used.
+        format (str): Printf-style format of the fractional minimum unit.
+
+    Returns:
+        Iterator[str]: Precise representations of the time differences.
+    """
+    return map(PreciseDeltaFormatter(minimum_unit, suppress, format), values)
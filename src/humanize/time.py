@@ -8,23 +8,45 @@ from __future__ import annotations
 __lazy_modules__ = {"humanize.i18n", "humanize.number"}
 
 from enum import Enum
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 
+from .i18n import _current_translation, _get_locale
 from .i18n import _gettext as _
-from .i18n import _ngettext
-from .number import intcomma
+from .i18n import _gettext_noop as N_
+from .i18n import _ngettext_noop as NS_
+from .number import NumberFormatter, _str_fallback, intcomma
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     import datetime as dt
-    from collections.abc import Iterable
-    from typing import Any
+    from collections.abc import Callable, Iterable, Iterator
+    from functools import _CacheInfo
+    from typing import Any, TypeAlias
+
+    # A message rendered by `naturaldelta`: (singular, plural, count, argument)
+    _Message: TypeAlias = tuple[str, str | None, int, float | None]
+    # Precomputed `precisedelta` options, see `_precisedelta_plan`
+    _PreciseDeltaPlan: TypeAlias = tuple[
+        int,
+        tuple[tuple[int, int], ...],
+        tuple[tuple[int, int], ...],
+        tuple[tuple[int, int], ...],
+        tuple[tuple[int, int, int], ...],
+        tuple[tuple[int, str, str], ...],
+        str,
+    ]
 
 __all__ = [
+    "DeltaFormatter",
+    "PreciseDeltaFormatter",
+    "cache_naturaldelta",
     "naturaldate",
     "naturalday",
     "naturaldelta",
+    "naturaldelta_cache_clear",
+    "naturaldelta_cache_info",
     "naturaltime",
+    "naturaltime_many",
     "precisedelta",
 ]
 
@@ -52,17 +74,19 @@ def _now() -> dt.datetime:
     return dt.datetime.now()
 
 
-def _abs_timedelta(delta: dt.timedelta) -> dt.timedelta:
+def _abs_timedelta(delta: dt.timedelta, now: dt.datetime | None = None) -> dt.timedelta:
     """Return an "absolute" value for a timedelta, always representing a time distance.
 
     Args:
         delta (datetime.timedelta): Input timedelta.
+        now (datetime.datetime): Current time, if already known.
 
     Returns:
         datetime.timedelta: Absolute timedelta.
     """
     if delta.days < 0:
-        now = _now()
+        if now is None:
+            now = _now()
         return now - (now + delta)
     return delta
 
@@ -91,7 +115,7 @@ def _date_and_delta(
             date = now - delta
         except (ValueError, TypeError):
             return None, value
-    return date, _abs_timedelta(delta)
+    return date, _abs_timedelta(delta, now)
 
 
 def naturaldelta(
@@ -136,27 +160,153 @@ def naturaldelta(
         ```
 
     """
-    import datetime as dt
+    min_unit = _naturaldelta_minimum_unit(minimum_unit)
+    if not _naturaldelta_caching:
+        return _naturaldelta(value, months, min_unit, _unit_strings(), intcomma)
+
+    delta = _to_timedelta(value)
+    if delta is None:
+        return _str_fallback(value)
+    message = _naturaldelta_message(abs(delta), months, min_unit)
+    return _naturaldelta_cache(_get_locale(), message)
+
 
-    tmp = Unit[minimum_unit.upper()]
-    if tmp not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
+def _naturaldelta_minimum_unit(minimum_unit: str) -> Unit:
+    """Validate a `minimum_unit` argument of `naturaldelta`."""
+    min_unit = Unit[minimum_unit.upper()]
+    if min_unit not in (Unit.SECONDS, Unit.MILLISECONDS, Unit.MICROSECONDS):
         msg = f"Minimum unit '{minimum_unit}' not supported"
         raise ValueError(msg)
-    min_unit = tmp
+    return min_unit
+
+
+def _naturaldelta(
+    value: dt.timedelta | float,
+    months: bool,
+    min_unit: Unit,
+    strings: _UnitStrings,
+    intcomma: Callable[[int], str],
+) -> str:
+    """Implement `naturaldelta` with the translated strings passed in."""
+    delta = _to_timedelta(value)
+    if delta is None:
+        return _str_fallback(value)
+    message = _naturaldelta_message(abs(delta), months, min_unit)
+    return _render_message(message, strings, intcomma)
+
+
+def _to_timedelta(value: dt.timedelta | float) -> dt.timedelta | None:
+    """Convert a timedelta or a number of seconds for `naturaldelta`, or `None`."""
+    import datetime as dt
 
     if isinstance(value, dt.timedelta):
-        delta = value
-    else:
+        return value
+    try:
+        int(value)  # Explicitly don't support string such as "NaN" or "inf"
+        return dt.timedelta(seconds=float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+# Messages rendered by `naturaldelta`. Each is picked as a tuple of (singular,
+# plural, count, argument): with no plural, the singular is translated as is; with no
+# argument, the count is formatted with `intcomma`; otherwise the argument is
+# formatted into the translation of the plural form for the count.
+_A_MOMENT = N_("a moment")
+_A_SECOND = N_("a second")
+_A_MINUTE = N_("a minute")
+_AN_HOUR = N_("an hour")
+_A_DAY = N_("a day")
+_A_MONTH = N_("a month")
+_A_YEAR = N_("a year")
+_ONE_YEAR_ONE_MONTH = N_("1 year, 1 month")
+_MICROSECONDS = NS_("%d microsecond", "%d microseconds")
+_MILLISECONDS = NS_("%d millisecond", "%d milliseconds")
+_SECONDS = NS_("%d second", "%d seconds")
+_MINUTES = NS_("%d minute", "%d minutes")
+_HOURS = NS_("%d hour", "%d hours")
+_DAYS = NS_("%d day", "%d days")
+_MONTHS = NS_("%d month", "%d months")
+_YEARS = NS_("%d year", "%d years")
+_ONE_YEAR_DAYS = NS_("1 year, %d day", "1 year, %d days")
+_ONE_YEAR_MONTHS = NS_("1 year, %d month", "1 year, %d months")
+
+# Counts below this are rendered once per translation, see `_UnitStrings`
+_SMALL_COUNTS = 1_000
+
+
+class _UnitStrings:
+    """The strings of the time functions in one translation.
+
+    Each message is translated once and then looked up. The first time a plural
+    message is used, it is translated and formatted for every count below
+    `_SMALL_COUNTS`, so rendering a small count is an index into a tuple.
+    """
+
+    def __init__(self, translation: Any) -> None:
+        self.translation = translation
+        self.ngettext = translation.ngettext
+        self._texts: dict[str, str] = {}
+        self._templates: dict[str, tuple[str, ...]] = {}
+        self._counts: dict[str, tuple[str, ...]] = {}
+
+    def text(self, message: str) -> str:
+        """Return the translation of `message`."""
         try:
-            int(value)  # Explicitly don't support string such as "NaN" or "inf"
-            value = float(value)
-            delta = dt.timedelta(seconds=value)
-        except (ValueError, TypeError):
-            return str(value)
+            return self._texts[message]
+        except KeyError:
+            text = self.translation.gettext(message)
+            return self._texts.setdefault(message, text)
 
-    use_months = months
+    def templates(self, singular: str, plural: str) -> tuple[str, ...]:
+        """Return the translation of the plural message for each small count."""
+        try:
+            return self._templates[singular]
+        except KeyError:
+            ngettext = self.ngettext
+            templates = tuple(
+                ngettext(singular, plural, n) for n in range(_SMALL_COUNTS)
+            )
+            return self._templates.setdefault(singular, templates)
+
+    def counts(self, singular: str, plural: str) -> tuple[str, ...]:
+        """Return the plural message formatted with each small count."""
+        try:
+            return self._counts[singular]
+        except KeyError:
+            templates = self.templates(singular, plural)
+            counts = tuple(template % n for n, template in enumerate(templates))
+            return self._counts.setdefault(singular, counts)
 
-    delta = abs(delta)
+    def template(self, singular: str, plural: str, count: int) -> str:
+        """Return the translation of the plural message for `count`."""
+        if 0 <= count < _SMALL_COUNTS:
+            return self.templates(singular, plural)[count]
+        return str(self.ngettext(singular, plural, count))
+
+
+# Mapping of translation to its strings. Keyed by the translation object rather
+# than the locale, so a catalog loaded again gets a new table.
+_UNIT_STRINGS: dict[Any, _UnitStrings] = {}
+
+
+def _unit_strings() -> _UnitStrings:
+    """Return the strings of the active translation."""
+    translation = _current_translation()
+    try:
+        return _UNIT_STRINGS[translation]
+    except KeyError:
+        return _UNIT_STRINGS.setdefault(translation, _UnitStrings(translation))
+
+
+def _naturaldelta_message(
+    delta: dt.timedelta, use_months: bool, min_unit: Unit
+) -> _Message:
+    """Pick the message `naturaldelta` renders for a non-negative `delta`.
+
+    Deltas that round to the same output share a message, so it doubles as a key
+    for caching the rendered string.
+    """
     years = delta.days // 365
     days = delta.days % 365
     num_months = round(days / 30.5)
@@ -164,88 +314,146 @@ def naturaldelta(
     if years == 0 and days < 1:
         if delta.seconds == 0:
             if min_unit == Unit.MICROSECONDS and delta.microseconds < 1000:
-                return (
-                    _ngettext("%d microsecond", "%d microseconds", delta.microseconds)
-                    % delta.microseconds
-                )
+                return (*_MICROSECONDS, delta.microseconds, delta.microseconds)
 
             if min_unit == Unit.MILLISECONDS or (
                 min_unit == Unit.MICROSECONDS and 1000 <= delta.microseconds < 1_000_000
             ):
                 milliseconds = delta.microseconds / 1000
-                return (
-                    _ngettext("%d millisecond", "%d milliseconds", int(milliseconds))
-                    % milliseconds
-                )
-            return _("a moment")
+                return (*_MILLISECONDS, int(milliseconds), milliseconds)
+            return (_A_MOMENT, None, 0, None)
 
         if delta.seconds == 1:
-            return _("a second")
+            return (_A_SECOND, None, 0, None)
 
         if delta.seconds < 60:
-            return _ngettext("%d second", "%d seconds", delta.seconds) % delta.seconds
+            return (*_SECONDS, delta.seconds, delta.seconds)
 
         if 60 <= delta.seconds < 3600:
             minutes = round(delta.seconds / 60)
             if minutes == 1:
-                return _("a minute")
+                return (_A_MINUTE, None, 0, None)
 
             if minutes == 60:
-                return _("an hour")
+                return (_AN_HOUR, None, 0, None)
 
-            return _ngettext("%d minute", "%d minutes", minutes) % minutes
+            return (*_MINUTES, minutes, minutes)
 
-        if 3600 <= delta.seconds:
-            hours = round(delta.seconds / 3600)
-            if hours == 1:
-                return _("an hour")
+        hours = round(delta.seconds / 3600)
+        if hours == 1:
+            return (_AN_HOUR, None, 0, None)
 
-            if hours == 24:
-                return _("a day")
+        if hours == 24:
+            return (_A_DAY, None, 0, None)
 
-            return _ngettext("%d hour", "%d hours", hours) % hours
+        return (*_HOURS, hours, hours)
 
     elif years == 0:
         if days == 1:
-            return _("a day")
+            return (_A_DAY, None, 0, None)
 
         if not use_months:
-            return _ngettext("%d day", "%d days", days) % days
+            return (*_DAYS, days, days)
 
         if num_months == 0:
-            return _ngettext("%d day", "%d days", days) % days
+            return (*_DAYS, days, days)
 
         if num_months == 1:
-            return _("a month")
+            return (_A_MONTH, None, 0, None)
 
         if num_months == 12:
-            return _("a year")
+            return (_A_YEAR, None, 0, None)
 
-        return _ngettext("%d month", "%d months", num_months) % num_months
+        return (*_MONTHS, num_months, num_months)
 
     elif years == 1:
         if num_months == 0 and days == 0:
-            return _("a year")
+            return (_A_YEAR, None, 0, None)
 
         if num_months == 0:
-            return _ngettext("1 year, %d day", "1 year, %d days", days) % days
+            return (*_ONE_YEAR_DAYS, days, days)
 
         if use_months:
             if num_months == 1:
-                return _("1 year, 1 month")
+                return (_ONE_YEAR_ONE_MONTH, None, 0, None)
 
             if num_months == 12:
                 years += 1
-                return _ngettext("%d year", "%d years", years) % years
+                return (*_YEARS, years, years)
 
-            return (
-                _ngettext("1 year, %d month", "1 year, %d months", num_months)
-                % num_months
-            )
+            return (*_ONE_YEAR_MONTHS, num_months, num_months)
+
+        return (*_ONE_YEAR_DAYS, days, days)
+
+    return (*_YEARS, years, None)
+
+
+def _render_message(
+    message: _Message, strings: _UnitStrings, intcomma: Callable[[int], str]
+) -> str:
+    """Translate and format a message picked by `_naturaldelta_message`."""
+    singular, plural, count, argument = message
+    if plural is None:
+        return strings.text(singular)
+    if count < _SMALL_COUNTS and not isinstance(argument, float):
+        # Small counts need no thousands separators
+        return strings.counts(singular, plural)[count]
+    template = strings.template(singular, plural, count)
+    if argument is None:
+        return template.replace("%d", "%s") % intcomma(count)
+    return template % argument
+
+
+def _render_current_locale(locale: str | None, message: _Message) -> str:
+    """Render a message in the current locale, which is passed for cache keys."""
+    return _render_message(message, _unit_strings(), intcomma)
+
+
+_naturaldelta_cache = lru_cache(maxsize=0)(_render_current_locale)
+_naturaldelta_caching = False
+
+
+def cache_naturaldelta(maxsize: int | None = 1024) -> None:
+    """Cache the strings rendered by `naturaldelta` and `naturaltime`.
+
+    `naturaldelta` returns one of a small set of strings for any delta: every delta
+    from 90 to 149 seconds is "2 minutes". With the cache on, each string is
+    translated and formatted once per locale, and later calls only look it up.
+    Calling this again replaces the cache with an empty one.
+
+    ```pycon
+    >>> from humanize.time import cache_naturaldelta, naturaldelta_cache_info
+    >>> cache_naturaldelta(maxsize=128)
+    >>> naturaldelta(90), naturaldelta(149)
+    ('2 minutes', '2 minutes')
+    >>> naturaldelta_cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+    >>> cache_naturaldelta(maxsize=0)
+
+    ```
+
+    Args:
+        maxsize (int, None): Most strings to keep, dropping the least recently used
+            first. If `None`, the cache is unbounded. If `0`, caching is turned off.
+    """
+    global _naturaldelta_cache, _naturaldelta_caching
+
+    _naturaldelta_cache = lru_cache(maxsize=maxsize)(_render_current_locale)
+    _naturaldelta_caching = maxsize != 0
+
+
+def naturaldelta_cache_info() -> _CacheInfo:
+    """Report the hits, misses and size of the `naturaldelta` cache.
+
+    Returns:
+        CacheInfo: Statistics as for `functools.lru_cache`.
+    """
+    return _naturaldelta_cache.cache_info()
 
-        return _ngettext("1 year, %d day", "1 year, %d days", days) % days
 
-    return _ngettext("%d year", "%d years", years).replace("%d", "%s") % intcomma(years)
+def naturaldelta_cache_clear() -> None:
+    """Empty the `naturaldelta` cache and reset its statistics."""
+    _naturaldelta_cache.cache_clear()
 
 
 def naturaltime(
@@ -285,20 +493,104 @@ def naturaltime(
 
     date, delta = _date_and_delta(value, now=now)
     if date is None:
-        return str(value)
+        return _str_fallback(value)
     # determine tense by value only if datetime/timedelta were passed
     if isinstance(value, (dt.datetime, dt.timedelta)):
         future = date > now
 
-    ago = _("%s from now") if future else _("%s ago")
+    strings = _unit_strings()
+    ago = strings.text("%s from now") if future else strings.text("%s ago")
     delta = naturaldelta(delta, months, minimum_unit)
 
-    if delta == _("a moment"):
-        return _("now")
+    if delta == strings.text("a moment"):
+        return strings.text("now")
 
     return str(ago % delta)
 
 
+def naturaltime_many(
+    values: Iterable[dt.datetime | dt.timedelta | float],
+    future: bool = False,
+    months: bool = True,
+    minimum_unit: str = "seconds",
+    when: dt.datetime | None = None,
+) -> list[str]:
+    """Return natural representations of many times, relative to a single moment.
+
+    The result is the same as calling `naturaltime` on each element with the same
+    `when`. The current time is read once, so every row is relative to the same
+    moment, and the translations are looked up once for the whole batch.
+
+    ```pycon
+    >>> import datetime as dt
+    >>> when = dt.datetime(2024, 1, 1, 12, 0)
+    >>> naturaltime_many([when - dt.timedelta(hours=3), 30, when], when=when)
+    ['3 hours ago', '30 seconds ago', 'now']
+
+    ```
+
+    Args:
+        values (iterable of datetime.datetime, datetime.timedelta, int or float):
+            `datetime`s, `timedelta`s, or numbers of seconds.
+        future (bool): Ignored for `datetime`s and `timedelta`s, where the tense is
+            always figured out based on the current time. For integers and floats, the
+            return value will be past tense by default, unless future is `True`.
+        months (bool): If `True`, then a number of months (based on 30.5 days) will be
+            used for fuzziness between years.
+        minimum_unit (str): The lowest unit that can be used.
+        when (datetime.datetime): Point in time relative to which _values_ are
+            interpreted.  Defaults to the current time in the local timezone.
+
+    Returns:
+        list[str]: Natural representations of the inputs, in order.
+    """
+    now = _convert_aware_datetime(when) or _now()
+    return list(_naturaltimes(values, future, months, minimum_unit, now))
+
+
+def _naturaltimes(
+    values: Iterable[dt.datetime | dt.timedelta | float],
+    future: bool,
+    months: bool,
+    minimum_unit: str,
+    now: dt.datetime,
+) -> Iterator[str]:
+    """Return an iterator of `naturaltime` for each of `values`, relative to `now`.
+
+    The options and the current locale are bound immediately, the values are
+    formatted as the iterator is consumed.
+    """
+    import datetime as dt
+
+    delta_formatter = DeltaFormatter(months, minimum_unit)
+    strings = delta_formatter._strings
+    ago = strings.text("%s ago")
+    from_now = strings.text("%s from now")
+    a_moment = strings.text("a moment")
+    just_now = strings.text("now")
+
+    def naturaltimes() -> Iterator[str]:
+        for value in values:
+            value = _convert_aware_datetime(value)
+            date, delta = _date_and_delta(value, now=now)
+            if date is None:
+                yield _str_fallback(value)
+                continue
+            # determine tense by value only if datetime/timedelta were passed
+            if isinstance(value, (dt.datetime, dt.timedelta)):
+                is_future = date > now
+            else:
+                is_future = future
+
+            text = delta_formatter(delta)
+            if text == a_moment:
+                yield just_now
+            else:
+                yield str((from_now if is_future else ago) % text)
+
+    return naturaltimes()
+
+
 def _convert_aware_datetime(
     value: dt.datetime | dt.timedelta | float | None,
 ) -> Any:
@@ -333,10 +625,10 @@ def naturalday(value: dt.date | dt.datetime, format: str = "%b %d") -> str:
         value = dt.date(value.year, value.month, value.day)
     except AttributeError:
         # Passed value wasn't date-ish
-        return str(value)
+        return _str_fallback(value)
     except (OverflowError, ValueError):
         # Date arguments out of range
-        return str(value)
+        return _str_fallback(value)
     delta = value - today
 
     if delta.days == 0:
@@ -364,61 +656,16 @@ def naturaldate(value: dt.date | dt.datetime) -> str:
         value = dt.date(value.year, value.month, value.day)
     except AttributeError:
         # Passed value wasn't date-ish
-        return str(value)
+        return _str_fallback(value)
     except (OverflowError, ValueError):
         # Date arguments out of range
-        return str(value)
+        return _str_fallback(value)
     delta = _abs_timedelta(value - today)
     if delta.days >= 5 * 365 / 12:
         return naturalday(original_value, "%b %d %Y")
     return naturalday(original_value)
 
 
-def _quotient_and_remainder(
-    value: float,
-    divisor: float,
-    unit: Unit,
-    minimum_unit: Unit,
-    suppress: Iterable[Unit],
-    format: str,
-) -> tuple[float, float]:
-    """Divide `value` by `divisor`, returning the quotient and remainder.
-
-    If `unit` is `minimum_unit`, the quotient will be the rounding of `value / divisor`
-    according to the `format` string and the remainder will be zero. The rationale is
-    that if `unit` is the unit of the quotient, we cannot represent the remainder
-    because it would require a unit smaller than the `minimum_unit`.
-
-    >>> from humanize.time import _quotient_and_remainder, Unit
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.DAYS, [], "%0.2f")
-    (1.5, 0)
-
-    If `unit` is in `suppress`, the quotient will be zero and the remainder will be the
-    initial value. The idea is that if we cannot use `unit`, we are forced to use a
-    lower unit, so we cannot do the division.
-
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [Unit.DAYS], "%0.2f")
-    (0, 36)
-
-    In other cases, return the quotient and remainder as `divmod` would do it.
-
-    >>> _quotient_and_remainder(36, 24, Unit.DAYS, Unit.HOURS, [], "%0.2f")
-    (1, 12)
-
-    """
-    if unit == minimum_unit:
-        return _rounding_by_fmt(format, value / divisor), 0
-
-    if unit in suppress:
-        return 0, value
-
-    # Convert the remainder back to integer is necessary for months. 1 month is 30.5
-    # days on average, but if we have 31 days, we want to count is as a whole month,
-    # and not as 1 month plus a remainder of 0.5 days.
-    q, r = divmod(value, divisor)
-    return q, int(r)
-
-
 def _suitable_minimum_unit(min_unit: Unit, suppress: Iterable[Unit]) -> Unit:
     """Return a minimum unit suitable that is not suppressed.
 
@@ -538,126 +785,169 @@ def precisedelta(
     """
     date, delta = _date_and_delta(value, precise=True)
     if date is None:
-        return str(value)
-
+        return _str_fallback(value)
+
+    plan = _precisedelta_plan(minimum_unit, tuple(suppress), format)
+    return _precisedelta(delta, plan, _unit_strings(), intcomma)
+
+
+_PRECISEDELTA_MESSAGES = (
+    _MICROSECONDS,
+    _MILLISECONDS,
+    _SECONDS,
+    _MINUTES,
+    _HOURS,
+    _DAYS,
+    _MONTHS,
+    _YEARS,
+)
+
+# How each unit is divided out of the delta, from largest to smallest:
+# (unit, divisor). Years and months are counted in half days so that a month of
+# 30.5 days divides exactly, then the rest in seconds and finally in microseconds.
+_DAY_DIVISORS = ((Unit.YEARS, 730), (Unit.MONTHS, 61))
+_SECOND_DIVISORS = ((Unit.DAYS, 86_400), (Unit.HOURS, 3_600), (Unit.MINUTES, 60))
+_MICROSECOND_DIVISORS = ((Unit.SECONDS, 1_000_000), (Unit.MILLISECONDS, 1_000))
+
+# Rounding can push a unit up to the next one: (unit, next unit, limit)
+_PROMOTIONS = (
+    (Unit.MILLISECONDS, Unit.SECONDS, 1_000),
+    (Unit.SECONDS, Unit.MINUTES, 60),
+    (Unit.MINUTES, Unit.HOURS, 60),
+    (Unit.HOURS, Unit.DAYS, 24),
+    (Unit.DAYS, Unit.MONTHS, 31),
+    (Unit.MONTHS, Unit.YEARS, 12),
+)
+
+
+@lru_cache(maxsize=256)
+def _precisedelta_plan(
+    minimum_unit: str, suppress: tuple[str, ...], format: str
+) -> _PreciseDeltaPlan:
+    """Precompute how `precisedelta` splits and renders a delta for its options.
+
+    Only the units that are shown get a division step, a promotion and a message.
+    The minimum unit is the last step and keeps the rest as a rounded fraction.
+    """
     suppress_set = {Unit[s.upper()] for s in suppress}
 
     # Find a suitable minimum unit (it can be greater than the one that the
     # user gave us, if that one is suppressed).
-    min_unit = Unit[minimum_unit.upper()]
-    min_unit = _suitable_minimum_unit(min_unit, suppress_set)
-    del minimum_unit
+    min_unit = _suitable_minimum_unit(Unit[minimum_unit.upper()], suppress_set)
 
     # Expand the suppressed units list/set to include all the units
     # that are below the minimum unit
     suppress_set = _suppress_lower_units(min_unit, suppress_set)
 
-    # handy aliases
-    days = delta.days
-    secs = delta.seconds
-    usecs = delta.microseconds
-
-    MILLISECONDS = Unit.MILLISECONDS
-    SECONDS = Unit.SECONDS
-    MINUTES = Unit.MINUTES
-    HOURS = Unit.HOURS
-    DAYS = Unit.DAYS
-    MONTHS = Unit.MONTHS
-    YEARS = Unit.YEARS
-
-    # Given DAYS compute YEARS and the remainder of DAYS as follows:
-    #   if YEARS is the minimum unit, we cannot use DAYS so
-    #   we will use a float for YEARS and 0 for DAYS:
-    #       years, days = years/days, 0
-    #
-    #   if YEARS is suppressed, use DAYS:
-    #       years, days = 0, days
-    #
-    #   otherwise:
-    #       years, days = divmod(years, days)
-    #
-    # The same applies for months, hours, minutes and milliseconds below
-    years, days = _quotient_and_remainder(
-        days, 365, YEARS, min_unit, suppress_set, format
+    def steps(divisors: tuple[tuple[Unit, int], ...]) -> tuple[tuple[int, int], ...]:
+        return tuple(
+            (unit.value, divisor)
+            for unit, divisor in divisors
+            if unit >= min_unit and unit not in suppress_set
+        )
+
+    promotions = tuple(
+        (unit.value, upper.value, limit)
+        for unit, upper, limit in _PROMOTIONS
+        if upper not in suppress_set
     )
-    months, days = _quotient_and_remainder(
-        days, 30.5, MONTHS, min_unit, suppress_set, format
+    shown = [
+        unit for unit in reversed(Unit) if unit >= min_unit and unit not in suppress_set
+    ]
+    if min_unit == Unit.YEARS:
+        shown.append(Unit.MICROSECONDS)
+    messages = tuple(
+        (unit.value, *_PRECISEDELTA_MESSAGES[unit.value]) for unit in shown
     )
-
-    secs = days * 24 * 3600 + secs
-    days, secs = _quotient_and_remainder(
-        secs, 24 * 3600, DAYS, min_unit, suppress_set, format
+    return (
+        min_unit.value,
+        steps(_DAY_DIVISORS),
+        steps(_SECOND_DIVISORS),
+        steps(_MICROSECOND_DIVISORS),
+        promotions,
+        messages,
+        format,
     )
 
-    hours, secs = _quotient_and_remainder(
-        secs, 3600, HOURS, min_unit, suppress_set, format
-    )
-    minutes, secs = _quotient_and_remainder(
-        secs, 60, MINUTES, min_unit, suppress_set, format
-    )
 
-    usecs = secs * 1e6 + usecs
-    secs, usecs = _quotient_and_remainder(
-        usecs, 1e6, SECONDS, min_unit, suppress_set, format
-    )
+def _precisedelta_values(delta: dt.timedelta, plan: _PreciseDeltaPlan) -> list[Any]:
+    """Split `delta` into a value per unit, indexed by `Unit.value`."""
+    min_unit, day_steps, second_steps, microsecond_steps, _, _, format = plan
+    values: list[Any] = [0] * 8
 
-    msecs, usecs = _quotient_and_remainder(
-        usecs, 1000, MILLISECONDS, min_unit, suppress_set, format
-    )
+    half_days = 2 * delta.days
+    for unit, divisor in day_steps:
+        if unit == min_unit:
+            values[unit] = _rounding_by_fmt(format, half_days / divisor)
+            # The time of day is left over as microseconds, see `_precisedelta`
+            values[Unit.MICROSECONDS.value] = (
+                delta.seconds * 1_000_000 + delta.microseconds
+            )
+            return values
+        values[unit], half_days = divmod(half_days, divisor)
+
+    # Only whole days carry over, a month's remaining half day is dropped
+    seconds = half_days // 2 * 86_400 + delta.seconds
+    for unit, divisor in second_steps:
+        if unit == min_unit:
+            values[unit] = _rounding_by_fmt(format, seconds / divisor)
+            return values
+        values[unit], seconds = divmod(seconds, divisor)
+
+    microseconds: Any = seconds * 1_000_000 + delta.microseconds
+    if microseconds > 2**53:
+        # Beyond float precision: round as the float arithmetic of old versions did
+        microseconds = seconds * 1e6 + delta.microseconds
+    for unit, divisor in microsecond_steps:
+        if unit == min_unit:
+            values[unit] = _rounding_by_fmt(format, microseconds / divisor)
+            return values
+        values[unit], microseconds = divmod(microseconds, divisor)
+        microseconds = int(microseconds)
+
+    values[Unit.MICROSECONDS.value] = microseconds
+    return values
+
+
+def _precisedelta(
+    delta: dt.timedelta,
+    plan: _PreciseDeltaPlan,
+    strings: _UnitStrings,
+    intcomma: Callable[[Any], str],
+) -> str:
+    """Render `delta` as `precisedelta` does, with the given translated strings."""
+    values = _precisedelta_values(delta, plan)
+    min_unit, _, _, _, promotions, messages, format = plan
 
     # Due to rounding, it could be that a unit is high enough to be promoted to a higher
     # unit. Example: 59.9 minutes was rounded to 60 minutes, and thus it should become 0
     # minutes and one hour more.
-    if msecs >= 1_000 and SECONDS not in suppress_set:
-        msecs -= 1_000
-        secs += 1
-    if secs >= 60 and MINUTES not in suppress_set:
-        secs -= 60
-        minutes += 1
-    if minutes >= 60 and HOURS not in suppress_set:
-        minutes -= 60
-        hours += 1
-    if hours >= 24 and DAYS not in suppress_set:
-        hours -= 24
-        days += 1
-    # When adjusting we should not deal anymore with fractional days as all rounding has
-    # been already made. We promote 31 days to an extra month.
-    if days >= 31 and MONTHS not in suppress_set:
-        days -= 31
-        months += 1
-    if months >= 12 and YEARS not in suppress_set:
-        months -= 12
-        years += 1
-
-    fmts = [
-        ("%d year", "%d years", years),
-        ("%d month", "%d months", months),
-        ("%d day", "%d days", days),
-        ("%d hour", "%d hours", hours),
-        ("%d minute", "%d minutes", minutes),
-        ("%d second", "%d seconds", secs),
-        ("%d millisecond", "%d milliseconds", msecs),
-        ("%d microsecond", "%d microseconds", usecs),
-    ]
-
-    import math
+    for unit, upper, limit in promotions:
+        if values[unit] >= limit:
+            values[unit] -= limit
+            values[upper] += 1
 
     texts: list[str] = []
-    for unit, fmt in zip(reversed(Unit), fmts):
-        singular_txt, plural_txt, fmt_value = fmt
-        if fmt_value > 0 or (not texts and unit == min_unit):
-            _fmt_value = 2 if 1 < fmt_value < 2 else int(fmt_value)
-            fmt_txt = _ngettext(singular_txt, plural_txt, _fmt_value)
-            if unit == min_unit and math.modf(fmt_value)[0] > 0:
-                fmt_txt = fmt_txt.replace("%d", format)
-            elif unit == YEARS:
-                if math.modf(fmt_value)[0] == 0:
-                    fmt_value = int(fmt_value)
-                fmt_txt = fmt_txt.replace("%d", "%s")
-                texts.append(fmt_txt % intcomma(fmt_value))
+    for unit, singular, plural in messages:
+        value = values[unit]
+        if value > 0 or (not texts and unit == min_unit):
+            count = 2 if 1 < value < 2 else int(value)
+            if unit == min_unit and value != count:
+                text = strings.template(singular, plural, count)
+                texts.append(text.replace("%d", format) % value)
+            elif unit == Unit.YEARS.value:
+                if count < _SMALL_COUNTS:
+                    texts.append(strings.counts(singular, plural)[count])
+                else:
+                    text = strings.template(singular, plural, count)
+                    texts.append(text.replace("%d", "%s") % intcomma(count))
+                # A whole number of years as the minimum unit is followed by the
+                # time of day in microseconds, as it always has been
                 continue
-
-            texts.append(fmt_txt % fmt_value)
+            elif count < _SMALL_COUNTS and isinstance(value, int):
+                texts.append(strings.counts(singular, plural)[count])
+            else:
+                texts.append(strings.template(singular, plural, count) % value)
 
         if unit == min_unit:
             break
@@ -665,10 +955,7 @@ def precisedelta(
     if len(texts) == 1:
         return texts[0]
 
-    head = ", ".join(texts[:-1])
-    tail = texts[-1]
-
-    return _("%s and %s") % (head, tail)
+    return strings.text("%s and %s") % (", ".join(texts[:-1]), texts[-1])
 
 
 def _rounding_by_fmt(format: str, value: float) -> float | int:
@@ -690,3 +977,128 @@ def _rounding_by_fmt(format: str, value: float) -> float | int:
         value = float(result)
 
     return value
+
+
+class DeltaFormatter:
+    """Format timedeltas like `naturaldelta`, in the locale active at creation.
+
+    The `minimum_unit` is validated and the translations and separators are looked
+    up once, when the formatter is created, instead of on every call. Activating
+    another locale later does not change the output of an existing formatter.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> fmt = DeltaFormatter(minimum_unit="milliseconds")
+        >>> fmt(dt.timedelta(milliseconds=4))
+        '4 milliseconds'
+        >>> fmt.format_many([30, dt.timedelta(days=400)])
+        ['30 seconds', '1 year, 1 month']
+
+        ```
+    """
+
+    def __init__(self, months: bool = True, minimum_unit: str = "seconds") -> None:
+        """Bind the options and the current locale.
+
+        Args:
+            months (bool): If `True`, then a number of months (based on 30.5 days)
+                will be used for fuzziness between years.
+            minimum_unit (str): The lowest unit that can be used.
+
+        Raises:
+            ValueError: If `minimum_unit` is not supported by `naturaldelta`.
+        """
+        self.months = months
+        self.minimum_unit = minimum_unit
+        self._min_unit = _naturaldelta_minimum_unit(minimum_unit)
+        self._strings = _unit_strings()
+        self._intcomma = NumberFormatter()
+
+    def __call__(self, value: dt.timedelta | float) -> str:
+        """Same as `naturaldelta(value, months, minimum_unit)`."""
+        return _naturaldelta(
+            value, self.months, self._min_unit, self._strings, self._intcomma
+        )
+
+    def format_many(self, values: Iterable[dt.timedelta | float]) -> list[str]:
+        """Same as calling the formatter on each value."""
+        months = self.months
+        min_unit = self._min_unit
+        strings = self._strings
+        intcomma = self._intcomma
+        return [
+            _naturaldelta(value, months, min_unit, strings, intcomma)
+            for value in values
+        ]
+
+
+class PreciseDeltaFormatter:
+    """Format timedeltas like `precisedelta`, in the locale active at creation.
+
+    The `minimum_unit` and `suppress` units are validated and resolved, and the
+    translations and separators are looked up once, when the formatter is created.
+    Calls then only split the delta and join the texts. Activating another locale
+    later does not change the output of an existing formatter.
+
+    Examples:
+        ```pycon
+        >>> import datetime as dt
+        >>> fmt = PreciseDeltaFormatter(suppress=["days"], format="%0.1f")
+        >>> fmt(dt.timedelta(days=2, seconds=3633, microseconds=123000))
+        '49 hours and 33.1 seconds'
+        >>> fmt.format_many([90, dt.timedelta(minutes=3)])
+        ['1 minute and 30 seconds', '3 minutes']
+
+        ```
+    """
+
+    def __init__(
+        self,
+        minimum_unit: str = "seconds",
+        suppress: Iterable[str] = (),
+        format: str = "%0.2f",
+    ) -> None:
+        """Bind the options and the current locale.
+
+        Args:
+            minimum_unit (str): The lowest unit that can be used.
+            suppress (Iterable[str]): Units that must not be used.
+            format (str): Printf-style format of the fractional minimum unit.
+
+        Raises:
+            KeyError: If `minimum_unit` or one of `suppress` is not a unit.
+            ValueError: If all units from `minimum_unit` up are suppressed.
+        """
+        self.minimum_unit = minimum_unit
+        self.suppress = tuple(suppress)
+        self.format = format
+        self._plan = _precisedelta_plan(minimum_unit, self.suppress, format)
+        self._strings = _unit_strings()
+        self._intcomma = NumberFormatter()
+
+    def __call__(self, value: dt.timedelta | float) -> str:
+        """Same as `precisedelta(value, minimum_unit, suppress, format)`."""
+        date, delta = _date_and_delta(value, precise=True)
+        if date is None:
+            return _str_fallback(value)
+        return _precisedelta(delta, self._plan, self._strings, self._intcomma)
+
+    def format_many(self, values: Iterable[dt.timedelta | float]) -> list[str]:
+        """Same as calling the formatter on each value.
+
+        The current time, used for datetimes and negative deltas, is read once for
+        the whole batch.
+        """
+        now = _now()
+        plan = self._plan
+        strings = self._strings
+        intcomma = self._intcomma
+        results = []
+        for value in values:
+            date, delta = _date_and_delta(value, now=now, precise=True)
+            if date is None:
+                results.append(_str_fallback(value))
+            else:
+                results.append(_precisedelta(delta, plan, strings, intcomma))
+        return results
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import datetime as dt
+import importlib
+import random
+import sys
+import typing
 
 import pytest
 
 import humanize
+from humanize._catalog import MappedTranslations
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pytest_codspeed import BenchmarkFixture
 
 
@@ -21,6 +28,18 @@ def _warmup_i18n() -> None:
     humanize.naturalday(dt.date.today())
 
 
+@pytest.fixture(params=[None, "fr_FR"])
+def locale(request: pytest.FixtureRequest) -> Iterator[str | None]:
+    try:
+        humanize.i18n.activate(request.param)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    try:
+        yield request.param
+    finally:
+        humanize.i18n.deactivate()
+
+
 def test_apnumber(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.apnumber, 7)
 
@@ -29,22 +48,139 @@ def test_clamp(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.clamp, 0.5, "{:.0%}", 0.1, 0.9)
 
 
+def test_delta_formatter(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.DeltaFormatter(), dt.timedelta(hours=3, minutes=27))
+
+
 def test_fractional(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.fractional, 1.5)
 
 
+@pytest.mark.parametrize("value", [1.5, 2 / 3, 0.3, 3.14159])
+def test_fractional_uncached(benchmark: BenchmarkFixture, value: float) -> None:
+    fractional = humanize.number._fractional.__wrapped__
+    benchmark(fractional, value)
+
+
+def test_fractional_many(benchmark: BenchmarkFixture) -> None:
+    # A recipe page: the same few hundred quantities over and over
+    rng = random.Random(0)
+    quantities = [
+        rng.randint(1, 40) / rng.choice([2, 3, 4, 8, 10, 16]) for _ in range(300)
+    ]
+    values = [rng.choice(quantities) for _ in range(1_000)]
+    benchmark(humanize.fractional_many, values)
+
+
+def test_gettext(benchmark: BenchmarkFixture, locale: str | None) -> None:
+    benchmark(humanize.i18n._gettext, "a moment")
+
+
+def test_import(benchmark: BenchmarkFixture) -> None:
+    # Time a fresh `import humanize`, then put back the already imported modules
+    # so the other benchmarks keep using them.
+    saved = {
+        name: module
+        for name, module in sys.modules.items()
+        if name.split(".")[0] == "humanize"
+    }
+
+    @benchmark
+    def _() -> None:
+        for name in saved:
+            sys.modules.pop(name, None)
+        importlib.import_module("humanize")
+
+    sys.modules.update(saved)
+
+
+def test_instrumented(benchmark: BenchmarkFixture) -> None:
+    from humanize import instrument
+
+    instrument.enable()
+    try:
+        benchmark(humanize.intcomma, 1_234_567)
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
 def test_intcomma(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.intcomma, 1_234_567_890)
 
 
+def test_intcomma_float(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.intcomma, 1_234_567.25)
+
+
+def test_intcomma_large_int(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.intcomma, 12_345_678_901_234_567_890)
+
+
+def test_intcomma_str(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.intcomma, "1234567890")
+
+
 def test_intword(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.intword, 1_234_567_890)
 
 
+@pytest.mark.parametrize("format", ["%.0f", "%.3f", "%d"])
+def test_intword_format(benchmark: BenchmarkFixture, format: str) -> None:
+    benchmark(humanize.intword, 1_234_567_890, format)
+
+
+def test_intword_loop(benchmark: BenchmarkFixture) -> None:
+    rng = random.Random(0)
+    values = [rng.randint(0, 10**12) for _ in range(1_000)]
+    benchmark(lambda: [humanize.intword(value) for value in values])
+
+
+def test_intword_many(benchmark: BenchmarkFixture) -> None:
+    rng = random.Random(0)
+    values = [rng.randint(0, 10**12) for _ in range(1_000)]
+    benchmark(humanize.intword_many, values)
+
+
+def test_intword_many_numpy(benchmark: BenchmarkFixture) -> None:
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).integers(0, 10**12, 1_000)
+    benchmark(humanize.intword_many, values)
+
+
+def test_intword_huge(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.intword, 7 * 10**120 + 123_456_789)
+
+
+def test_load_catalog(benchmark: BenchmarkFixture) -> None:
+    locale_path = humanize.i18n._get_default_locale_path()
+    assert locale_path is not None
+    mo_file = locale_path / "ru_RU" / "LC_MESSAGES" / "humanize.mo"
+    if not mo_file.exists():
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    @benchmark
+    def _() -> None:
+        with mo_file.open("rb") as fp:
+            MappedTranslations(fp)
+
+
 def test_metric(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.metric, 1500, "W")
 
 
+def test_metric_loop(benchmark: BenchmarkFixture) -> None:
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).uniform(-1e6, 1e6, 1_000)
+    benchmark(lambda: [humanize.metric(value, "V") for value in values])
+
+
+def test_metric_many(benchmark: BenchmarkFixture) -> None:
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).uniform(-1e6, 1e6, 1_000)
+    benchmark(humanize.metric_many, values, "V")
+
+
 def test_natural_list(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.natural_list, ["one", "two", "three", "four"])
 
@@ -61,22 +197,282 @@ def test_naturaldelta(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.naturaldelta, dt.timedelta(hours=3, minutes=27))
 
 
+def test_naturaldelta_locale(benchmark: BenchmarkFixture, locale: str | None) -> None:
+    benchmark(humanize.naturaldelta, dt.timedelta(hours=3, minutes=27))
+
+
+def test_naturaldelta_cached(benchmark: BenchmarkFixture) -> None:
+    humanize.time.cache_naturaldelta()
+    try:
+        benchmark(humanize.naturaldelta, dt.timedelta(hours=3, minutes=27))
+    finally:
+        humanize.time.cache_naturaldelta(maxsize=0)
+
+
 def test_naturalsize(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.naturalsize, 1_234_567_890)
 
 
+def test_naturalsize_many(benchmark: BenchmarkFixture) -> None:
+    values = [7**n for n in range(40)]
+    benchmark(humanize.naturalsize_many, values)
+
+
 def test_naturaltime(benchmark: BenchmarkFixture) -> None:
     when = dt.datetime.now() - dt.timedelta(hours=3, minutes=27)
     benchmark(humanize.naturaltime, when)
 
 
+def test_ngettext(benchmark: BenchmarkFixture, locale: str | None) -> None:
+    benchmark(humanize.i18n._ngettext, "%d minute", "%d minutes", 3)
+
+
+@pytest.mark.parametrize("locale", ["ar", "pl_PL", "ru_RU", "sl_SI", "uk_UA"])
+def test_ngettext_plural_forms(benchmark: BenchmarkFixture, locale: str) -> None:
+    ngettext = humanize.i18n._ngettext
+    counts = [1, 2, 5, 11, 21, 22, 25, 101, 112, 1_234]
+
+    def run() -> None:
+        for n in counts:
+            ngettext("%d second", "%d seconds", n)
+
+    try:
+        humanize.i18n.activate(locale)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        benchmark(run)
+    finally:
+        humanize.i18n.deactivate()
+
+
+def test_number_formatter(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.NumberFormatter(), 1_234_567_890)
+
+
+def test_naturaltime_many(benchmark: BenchmarkFixture) -> None:
+    now = dt.datetime.now()
+    values = [now - dt.timedelta(minutes=n) for n in range(0, 10_000, 100)]
+    benchmark(humanize.naturaltime_many, values, when=now)
+
+
 def test_ordinal(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.ordinal, 123)
 
 
+@pytest.mark.parametrize("locale", [None, "fr_FR", "es_ES"], indirect=True)
+@pytest.mark.parametrize("gender", ["male", "female"])
+def test_ordinal_gender(
+    benchmark: BenchmarkFixture, locale: str | None, gender: str
+) -> None:
+    benchmark(humanize.ordinal, 123, gender)
+
+
+@pytest.mark.parametrize("locale", [None, "fr_FR", "es_ES"], indirect=True)
+@pytest.mark.parametrize("gender", ["male", "female"])
+def test_ordinal_many(
+    benchmark: BenchmarkFixture, locale: str | None, gender: str
+) -> None:
+    benchmark(humanize.ordinal_many, range(1, 1_001), gender)
+
+
+def test_pgettext(benchmark: BenchmarkFixture, locale: str | None) -> None:
+    benchmark(humanize.i18n._pgettext, "0 (male)", "th")
+
+
+def test_precise_delta_formatter(benchmark: BenchmarkFixture) -> None:
+    benchmark(
+        humanize.PreciseDeltaFormatter(),
+        dt.timedelta(days=2, seconds=3633, microseconds=123000),
+    )
+
+
 def test_precisedelta(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.precisedelta, dt.timedelta(days=2, hours=3, seconds=4))
 
 
 def test_scientific(benchmark: BenchmarkFixture) -> None:
     benchmark(humanize.scientific, -1.234e-50)
+
+
+def test_scientific_loop(benchmark: BenchmarkFixture) -> None:
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).uniform(-1e6, 1e6, 1_000)
+    benchmark(lambda: [humanize.scientific(value) for value in values])
+
+
+def test_scientific_many(benchmark: BenchmarkFixture) -> None:
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).uniform(-1e6, 1e6, 1_000)
+    benchmark(humanize.scientific_many, values)
+
+
+def test_size_formatter(benchmark: BenchmarkFixture) -> None:
+    benchmark(humanize.SizeFormatter(), 1_234_567_890)
+
+
+# Every public function, in every shipped locale, over a spread of inputs: small,
+# large, negative, float, str, NaN and bad values, naive and aware datetimes. Each
+# entry maps a name in `humanize.__all__` to a function making the callable for a
+# locale, and the argument tuples it is called with.
+_NOW = dt.datetime.now()
+_AWARE_NOW = dt.datetime.now(dt.timezone.utc)
+_NUMBERS: list[typing.Any] = [
+    0,
+    7,
+    1_234,
+    -98_765,
+    12_345_678_901,
+    10**30,
+    0.5,
+    -1_234.567,
+    1e-7,
+    "1234567",
+    "-0.25",
+    float("nan"),
+    float("inf"),
+    "bad",
+]
+_FLOATS = [value for value in _NUMBERS if not isinstance(value, str)]
+_SIZES: list[typing.Any] = [0, 1, 300, 3_000, -4_096, 10**12, 10**30, 1.5e9, "5000"]
+_DELTAS: list[typing.Any] = [
+    dt.timedelta(microseconds=40),
+    dt.timedelta(milliseconds=1_500),
+    dt.timedelta(minutes=59, seconds=59.999),
+    dt.timedelta(hours=3, minutes=27),
+    dt.timedelta(days=2, seconds=3_633, microseconds=123_000),
+    dt.timedelta(days=400),
+    dt.timedelta(days=-40),
+    dt.timedelta(days=365 * 1_234),
+    30,
+    -4.5,
+    "NaN",
+]
+_TIMES: list[typing.Any] = [
+    _NOW - dt.timedelta(seconds=3),
+    _NOW + dt.timedelta(days=3),
+    _AWARE_NOW - dt.timedelta(hours=5),
+    _AWARE_NOW + dt.timedelta(days=800),
+    dt.timedelta(minutes=-90),
+    600,
+    "NaN",
+]
+_DAYS: list[typing.Any] = [
+    _NOW.date(),
+    _NOW.date() - dt.timedelta(days=1),
+    _NOW.date() + dt.timedelta(days=1),
+    _NOW - dt.timedelta(days=300),
+    _AWARE_NOW - dt.timedelta(days=3),
+    dt.date(1999, 12, 31),
+    "bad",
+]
+
+
+def _each(values: list[typing.Any], *args: typing.Any) -> list[tuple[typing.Any, ...]]:
+    return [(value, *args) for value in values]
+
+
+_MATRIX: dict[
+    str,
+    tuple[
+        typing.Callable[[str | None], typing.Callable[..., typing.Any]],
+        list[tuple[typing.Any, ...]],
+    ],
+] = {
+    "DeltaFormatter": (
+        lambda _: humanize.DeltaFormatter(minimum_unit="milliseconds"),
+        _each(_DELTAS),
+    ),
+    "NumberFormatter": (lambda _: humanize.NumberFormatter(2), _each(_NUMBERS)),
+    "PreciseDeltaFormatter": (
+        lambda _: humanize.PreciseDeltaFormatter(suppress=["days"]),
+        _each(_DELTAS),
+    ),
+    "SizeFormatter": (lambda _: humanize.SizeFormatter(binary=True), _each(_SIZES)),
+    "activate": (
+        lambda locale: lambda: humanize.activate(locale),
+        [()],
+    ),
+    "apnumber": (lambda _: humanize.apnumber, _each(_NUMBERS)),
+    "clamp": (
+        lambda _: humanize.clamp,
+        _each([0.0001, 0.5, 0.99999, float("nan")], "{:.0%}", 0.01, 0.99),
+    ),
+    "deactivate": (lambda _: humanize.deactivate, [()]),
+    "decimal_separator": (lambda _: humanize.decimal_separator, [()]),
+    "fractional": (lambda _: humanize.fractional, _each(_NUMBERS)),
+    "fractional_many": (lambda _: humanize.fractional_many, [(_NUMBERS,)]),
+    "intcomma": (
+        lambda _: humanize.intcomma,
+        _each(_NUMBERS) + _each(_NUMBERS[:-1], 2),
+    ),
+    "intword": (lambda _: humanize.intword, _each(_NUMBERS)),
+    "intword_many": (lambda _: humanize.intword_many, [(_NUMBERS,)]),
+    "metric": (lambda _: humanize.metric, _each(_FLOATS, "V")),
+    "metric_many": (lambda _: humanize.metric_many, [(_FLOATS, "V")]),
+    "natural_list": (
+        lambda _: humanize.natural_list,
+        [(["one"],), (["one", "two"],), ([1, 2, 3, 4],)],
+    ),
+    "naturaldate": (lambda _: humanize.naturaldate, _each(_DAYS)),
+    "naturalday": (lambda _: humanize.naturalday, _each(_DAYS)),
+    "naturaldelta": (
+        lambda _: humanize.naturaldelta,
+        _each(_DELTAS) + _each(_DELTAS, False, "microseconds"),
+    ),
+    "naturalsize": (
+        lambda _: humanize.naturalsize,
+        _each(_SIZES) + _each(_SIZES, True) + _each(_SIZES, False, True),
+    ),
+    "naturalsize_many": (lambda _: humanize.naturalsize_many, [(_SIZES,)]),
+    "naturaltime": (
+        lambda _: humanize.naturaltime,
+        _each(_TIMES) + _each(_TIMES, True, False, "milliseconds"),
+    ),
+    "naturaltime_many": (lambda _: humanize.naturaltime_many, [(_TIMES,)]),
+    "ordinal": (
+        lambda _: humanize.ordinal,
+        _each(_NUMBERS) + _each(_NUMBERS, "female"),
+    ),
+    "ordinal_many": (
+        lambda _: humanize.ordinal_many,
+        [(_NUMBERS,), (_NUMBERS, "female")],
+    ),
+    "precisedelta": (
+        lambda _: humanize.precisedelta,
+        _each(_DELTAS) + _each(_DELTAS, "minutes", ["hours"], "%0.1f"),
+    ),
+    "scientific": (lambda _: humanize.scientific, _each(_NUMBERS)),
+    "scientific_many": (lambda _: humanize.scientific_many, [(_NUMBERS,)]),
+    "thousands_separator": (lambda _: humanize.thousands_separator, [()]),
+}
+
+
+def _shipped_locales() -> list[str | None]:
+    locale_path = humanize.i18n._get_default_locale_path()
+    assert locale_path is not None
+    return [None, *sorted(path.name for path in locale_path.iterdir() if path.is_dir())]
+
+
+def test_matrix_covers_public_api() -> None:
+    assert set(_MATRIX) == set(humanize.__all__) - {"__version__"}
+
+
+@pytest.mark.parametrize("locale", _shipped_locales())
+@pytest.mark.parametrize("name", sorted(_MATRIX))
+def test_matrix(benchmark: BenchmarkFixture, name: str, locale: str | None) -> None:
+    make, calls = _MATRIX[name]
+
+    def run() -> None:
+        for args in calls:
+            func(*args)
+
+    try:
+        humanize.i18n.activate(locale)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        func = make(locale)
+        benchmark(run)
+    finally:
+        humanize.i18n.deactivate()
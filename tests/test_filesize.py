@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import typing
+
 import pytest
 
 import humanize
@@ -103,3 +105,87 @@ def test_naturalsize(test_args: list[int] | list[int | bool], expected: str) ->
         test_args[0] = f"-{test_args[0]}"
 
     assert humanize.naturalsize(*test_args) == "-" + expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"binary": True},
+        {"gnu": True},
+        {"format": "%.3f"},
+        {"binary": True, "format": "%.0f"},
+    ],
+)
+def test_naturalsize_many(kwargs: dict[str, typing.Any]) -> None:
+    values: list[float | str] = [
+        0,
+        1,
+        -1,
+        1.0,
+        "1",
+        300,
+        1023,
+        1024,
+        3000,
+        999999,
+        -999999,
+        1024**2 - 1,
+        3141592,
+        1.123456789 * 10**6,
+        "-12345678",
+        10**34 * 3,
+        -(1024**10) * 40,
+    ]
+    expected = [humanize.naturalsize(value, **kwargs) for value in values]
+    assert humanize.naturalsize_many(values, **kwargs) == expected
+    assert humanize.naturalsize_many(iter(values), **kwargs) == expected
+
+
+def test_naturalsize_many_empty() -> None:
+    assert humanize.naturalsize_many([]) == []
+
+
+def test_naturalsize_many_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    values = np.array([1, 300, 3000, 999999, -4096, 10**15], dtype=np.int64)
+    expected = [humanize.naturalsize(int(value)) for value in values]
+    assert humanize.naturalsize_many(values) == expected
+    assert humanize.naturalsize_many(values.astype(np.float64)) == expected
+
+
+@pytest.mark.parametrize("format", ["%.1f", "%.3f", "%d", "%.2e", "%s"])
+@pytest.mark.parametrize("binary, gnu", [(False, False), (True, False), (False, True)])
+def test_naturalsize_many_numpy_matches_scalar(
+    format: str, binary: bool, gnu: bool
+) -> None:
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(0)
+    values = np.concatenate(
+        [
+            10 ** rng.uniform(0, 30, 2_000),
+            -(10 ** rng.uniform(0, 30, 200)),
+            [0.0, 999.95, 1023.95, 999_950.0, 1024.0**3, 1000.0**10, 2.0**64],
+        ]
+    )
+    expected = [humanize.naturalsize(v, binary, gnu, format) for v in values.tolist()]
+    assert humanize.naturalsize_many(values, binary, gnu, format) == expected
+
+
+@pytest.mark.parametrize(
+    "binary, gnu, format",
+    [
+        (False, False, "%.1f"),
+        (True, False, "%.1f"),
+        (False, True, "%.1f"),
+        (True, False, "%.3f"),
+    ],
+)
+def test_size_formatter(binary: bool, gnu: bool, format: str) -> None:
+    fmt = humanize.SizeFormatter(binary, gnu, format)
+    values: list[float | str] = [1, -1, 300, 3000, "1000", 999999, 10**28, -(1024**3)]
+    values += [999.95, 1023.95, -999_950.0, 1000.0**10, 2.0**64, 0.5]
+    for value in values:
+        assert fmt(value) == humanize.naturalsize(value, binary, gnu, format)
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import datetime as dt
 import importlib
+import os
+import pathlib
+import sys
+import typing
 
 import pytest
 from freezegun import freeze_time
 
 import humanize
+from humanize._catalog import MappedCatalog, MappedTranslations, memoize_plural
 
 with freeze_time("2020-02-02"):
     NOW = dt.datetime.now(tz=dt.timezone.utc)
@@ -56,6 +61,8 @@ def test_intcomma() -> None:
         assert humanize.intcomma("1234567,89") == "1.234.567,89"
         assert humanize.intcomma("1.234.567,89") == "1.234.567,89"
         assert humanize.intcomma("1.234.567,8") == "1.234.567,8"
+        assert humanize.intcomma("1234567") == "1.234.567"
+        assert humanize.intcomma(-1234567, 2) == "-1.234.567,00"
 
         humanize.i18n.activate("fr_FR")
         assert humanize.intcomma(number) == "10 000 000"
@@ -124,6 +131,12 @@ def test_naturaldelta() -> None:
         ("fr_FR", "-1_000_000", "-1.0 million"),
         ("fr_FR", "1_200_000", "1.2 millions"),
         ("fr_FR", "1_290_000", "1.3 millions"),
+        ("fr_FR", "1_050_000", "1.1 millions"),
+        ("fr_FR", "1_150_000", "1.1 millions"),
+        ("fr_FR", "1_950_000", "1.9 millions"),
+        ("ru_RU", "1_050_000", "1.1 миллиона"),
+        ("ru_RU", "1_150_000", "1.1 миллиона"),
+        ("ru_RU", "1_950_000", "1.9 миллиона"),
         ("fr_FR", "999_999_999", "1.0 milliard"),
         ("fr_FR", "1_000_000_000", "1.0 milliard"),
         ("fr_FR", "-1_000_000_000", "-1.0 milliard"),
@@ -171,6 +184,21 @@ def test_intword_i18n(locale: str, number: int, expected_result: str) -> None:
         humanize.i18n.deactivate()
 
 
+@pytest.mark.parametrize("locale", ["fr_FR", "ru_RU", "pl_PL", "ar"])
+def test_intword_many_i18n(locale: str) -> None:
+    values = [1_000 * n + 400 for n in range(1, 1_000, 7)] + [10**n for n in range(120)]
+    try:
+        humanize.i18n.activate(locale)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        for format in ("%.1f", "%.0f"):
+            expected = [humanize.intword(value, format) for value in values]
+            assert humanize.intword_many(values, format) == expected
+    finally:
+        humanize.i18n.deactivate()
+
+
 @pytest.mark.parametrize(
     "locale, value, expected_result",
     [
@@ -252,6 +280,28 @@ def test_ordinal_genders(
         humanize.i18n.deactivate()
 
 
+@pytest.mark.parametrize("locale", ["fr_FR", "es_ES", "it_IT", "pt_PT"])
+def test_ordinal_many_genders(locale: str) -> None:
+    values = list(range(-5, 130))
+    try:
+        translation = humanize.i18n.activate(locale)
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    else:
+        for gender in ("male", "female"):
+            expected = []
+            for value in values:
+                digit = 0 if value % 100 in (11, 12, 13) else value % 10
+                suffix = humanize.number._ORDINAL_SUFFIXES[digit]
+                context = f"{digit} ({gender})"
+                expected.append(f"{value}{translation.pgettext(context, suffix)}")
+            assert [humanize.ordinal(value, gender) for value in values] == expected
+            assert humanize.ordinal_many(values, gender) == expected
+    finally:
+        humanize.i18n.deactivate()
+    assert humanize.ordinal_many([1, 2], "female") == ["1st", "2nd"]
+
+
 def test_default_locale_path_defined__spec__() -> None:
     i18n = importlib.import_module("humanize.i18n")
     assert i18n._get_default_locale_path() is not None
@@ -324,3 +374,336 @@ class TestActivate:
             humanize.i18n.deactivate()
 
         assert test_str == humanize.naturaltime(three_seconds)
+
+
+def test_formatters_bind_locale() -> None:
+    try:
+        humanize.i18n.activate("fr_FR")
+        number_fmt = humanize.NumberFormatter()
+        size_fmt = humanize.SizeFormatter()
+        delta_fmt = humanize.DeltaFormatter()
+        precise_fmt = humanize.PreciseDeltaFormatter()
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+
+    # The locale active at creation is used, not the current one
+    assert number_fmt(10_000_000) == "10 000 000"
+    assert number_fmt.intword("1_200_000") == "1.2 millions"
+    assert size_fmt(42_000) == "42.0 Ko"
+    assert delta_fmt(1234 * 365 * 24 * 60 * 60) == "1 234 ans"
+    assert precise_fmt(1234 * 365 * 24 * 60 * 60 + 3) == "1 234 ans et 3 secondes"
+    assert humanize.intcomma(10_000_000) == "10,000,000"
+
+
+def test_naturaldelta_cache_per_locale() -> None:
+    humanize.time.cache_naturaldelta(maxsize=16)
+    try:
+        assert humanize.naturaldelta(90) == "2 minutes"
+        humanize.i18n.activate("fr_FR")
+        assert humanize.naturaldelta(90) == "2 minutes"
+        assert humanize.naturaldelta(3) == "3 secondes"
+        humanize.i18n.activate("ru_RU")
+        assert humanize.naturaldelta(3) == "3 секунды"
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+        humanize.time.cache_naturaldelta(maxsize=0)
+    assert humanize.naturaldelta(3) == "3 seconds"
+
+
+def test_unit_strings_per_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    try:
+        translation = humanize.i18n.activate("ru_RU")
+        strings = humanize.time._unit_strings()
+        assert humanize.time._unit_strings() is strings
+        seconds = strings.counts("%d second", "%d seconds")
+        for n in (0, 1, 2, 5, 11, 21, 22, 25, 111, 999):
+            assert seconds[n] == translation.ngettext("%d second", "%d seconds", n) % n
+        assert humanize.naturaldelta(22) == "22 секунды"
+        assert humanize.naturaldelta(dt.timedelta(days=365 * 1_001)) == "1,001 год"
+
+        # Loading the catalog again gives new strings
+        monkeypatch.setattr(humanize.i18n, "_TRANSLATIONS", {})
+        assert humanize.i18n.activate("ru_RU") is not translation
+        assert humanize.time._unit_strings() is not strings
+        assert humanize.naturaldelta(22) == "22 секунды"
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+
+
+def test_no_locale_returns_null_translations() -> None:
+    import gettext
+
+    translation = humanize.i18n.activate(None)
+    assert type(translation) is gettext.NullTranslations
+    assert translation.info() == {}
+    assert translation is humanize.i18n.activate("en_US")
+    assert translation is humanize.i18n.get_translation()
+    with humanize.i18n.locale(None) as scoped:
+        assert scoped is translation
+
+
+def test_identity_translations_match_gettext() -> None:
+    import gettext
+
+    expected = gettext.NullTranslations()
+    translation = humanize.i18n._IDENTITY
+    for n in (0, 1, 2, -1):
+        assert translation.ngettext("%d apple", "%d apples", n) == expected.ngettext(
+            "%d apple", "%d apples", n
+        )
+        assert translation.npgettext(
+            "fruit", "%d apple", "%d apples", n
+        ) == expected.npgettext("fruit", "%d apple", "%d apples", n)
+        assert humanize.i18n._ngettext("%d apple", "%d apples", n) == expected.ngettext(
+            "%d apple", "%d apples", n
+        )
+    assert translation.gettext("apple") == "apple"
+    assert translation.pgettext("fruit", "apple") == "apple"
+    assert humanize.i18n._gettext("apple") == "apple"
+    assert humanize.i18n._pgettext("fruit", "apple") == "apple"
+
+
+def test_gettext_imported_on_first_translation() -> None:
+    import subprocess
+    import sys
+
+    code = """if True:
+        import sys
+        import humanize
+
+        humanize.naturaldelta(3), humanize.naturalsize(3), humanize.ordinal(3)
+        assert "gettext" not in sys.modules
+        translation = humanize.i18n.activate("en_GB")
+        assert type(translation).__name__ == "NullTranslations"
+        try:
+            humanize.i18n.activate("fr_FR")
+        except FileNotFoundError:
+            sys.exit(3)
+        assert "gettext" in sys.modules
+        assert humanize.naturaldelta(3) == "3 secondes"
+    """
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    if result.returncode == 3:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    assert result.returncode == 0
+
+
+def test_mapped_catalog_matches_gettext() -> None:
+    import gettext
+
+    locale_path = humanize.i18n._get_default_locale_path()
+    assert locale_path is not None
+    mo_files = sorted(locale_path.glob("*/LC_MESSAGES/humanize.mo"))
+    if not mo_files:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    for mo_file in mo_files:
+        with mo_file.open("rb") as fp:
+            expected = gettext.GNUTranslations(fp)
+        with mo_file.open("rb") as fp:
+            mapped = MappedTranslations(fp)
+
+        assert mapped.info() == expected.info()
+        assert mapped.charset() == expected.charset()
+        plural = expected.plural  # type: ignore[attr-defined]
+        counts = [*range(-3, 250), 1_000, 1_001, 1_011, 1_021, 10**6, 2**70]
+        assert [mapped.plural(n) for n in counts] == [plural(n) for n in counts]
+        for key, value in expected._catalog.items():  # type: ignore[attr-defined]
+            assert mapped._catalog[key] == value
+        assert "not a message" not in mapped._catalog
+        assert ("not a message", 0) not in mapped._catalog
+        assert mapped.gettext("not a message") == "not a message"
+        assert mapped.ngettext("%d apple", "%d apples", 2) == "%d apples"
+
+
+def test_mapped_translations_fallback_without_fileno() -> None:
+    import io
+
+    locale_path = humanize.i18n._get_default_locale_path()
+    assert locale_path is not None
+    mo_file = locale_path / "fr_FR" / "LC_MESSAGES" / "humanize.mo"
+    if not mo_file.exists():
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    translation = MappedTranslations(io.BytesIO(mo_file.read_bytes()))
+    assert isinstance(translation._catalog, dict)
+    assert translation.ngettext("%d second", "%d seconds", 3) == "%d secondes"
+    assert translation.plural.__name__ == "plural_index"
+
+
+def test_memoize_plural() -> None:
+    import gettext
+
+    plural = gettext.c2py(
+        "(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && (n%100<10 || n%100>=20)"
+        " ? 1 : 2)"
+    )
+    memoized = memoize_plural(plural)
+    counts = [*range(-50, 3_000), 10**9 + 22, 2**80 + 1]
+    assert [memoized(n) for n in counts] == [plural(n) for n in counts]
+    assert [memoized(n) for n in counts] == [plural(n) for n in counts]
+    assert memoized(True) == plural(True)
+    with pytest.warns(DeprecationWarning, match="must be an integer"):
+        assert memoized(2.0) == 1  # type: ignore[arg-type]
+
+
+def test_mapped_translations_bad_file(tmp_path: pathlib.Path) -> None:
+    bad = tmp_path / "bad.mo"
+    bad.write_bytes(b"\0" * 32)
+    with bad.open("rb") as fp, pytest.raises(OSError, match="Bad magic number"):
+        MappedTranslations(fp)
+
+
+def test_preload() -> None:
+    try:
+        loaded = humanize.i18n.preload(["fr_FR", "en_GB", "ru_RU"])
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    assert loaded == ["fr_FR", "ru_RU"]
+    assert humanize.i18n._SEPARATOR_TABLE["fr_FR"] == str.maketrans(",.", " .")
+    translation = humanize.i18n._TRANSLATIONS["fr_FR"]
+    catalog = translation._catalog  # type: ignore[attr-defined]
+    if isinstance(catalog, MappedCatalog):
+        assert catalog._decoded[("%d second", 1)] == "%d secondes"
+
+    try:
+        assert humanize.i18n.activate("fr_FR") is translation
+        assert humanize.intcomma(1_234_567.5) == "1 234 567.5"
+    finally:
+        humanize.i18n.deactivate()
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 13) or not os.path.isdir("/proc/self/fd"),
+    reason="mmap keeps a file descriptor before Python 3.13",
+)
+def test_preload_keeps_no_file_descriptors() -> None:
+    locale_path = humanize.i18n._get_default_locale_path()
+    assert locale_path is not None
+    if not list(locale_path.glob("*/LC_MESSAGES/humanize.mo")):
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    before = len(os.listdir("/proc/self/fd"))
+    assert humanize.i18n.preload()
+    assert len(os.listdir("/proc/self/fd")) == before
+
+
+def test_preload_all(tmp_path: pathlib.Path) -> None:
+    try:
+        loaded = humanize.i18n.preload()
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    assert "de_DE" in loaded
+    assert loaded == sorted(loaded)
+    assert set(loaded) <= set(humanize.i18n._TRANSLATIONS)
+    assert humanize.i18n.preload(path=tmp_path) == []
+    with pytest.raises(FileNotFoundError):
+        humanize.i18n.preload(["xx_XX"])
+
+
+@freeze_time("2020-02-02")
+def test_activate_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    import gettext
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    three_seconds = NOW - dt.timedelta(seconds=3)
+    expected = {
+        None: "3 seconds ago",
+        "fr_FR": "il y a 3 secondes",
+        "de_DE": "vor 3 Sekunden",
+        "ru_RU": "3 секунды назад",
+    }
+    loads: list[str] = []
+    translation = gettext.translation
+
+    def counting_translation(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        loads.append(args[2][0])
+        return translation(*args, **kwargs)
+
+    monkeypatch.setattr(humanize.i18n, "_TRANSLATIONS", {})
+    monkeypatch.setattr(humanize.i18n, "_LOAD_LOCKS", {})
+    monkeypatch.setattr(gettext, "translation", counting_translation)
+    barrier = threading.Barrier(32)
+
+    def worker(offset: int) -> list[str]:
+        locales = list(expected)
+        barrier.wait()
+        results = []
+        try:
+            for i in range(200):
+                locale = locales[(offset + i) % len(locales)]
+                humanize.i18n.activate(locale)
+                results.append(humanize.naturaltime(three_seconds))
+                if results[-1] != expected[locale]:
+                    break
+        finally:
+            humanize.i18n.deactivate()
+        return results
+
+    try:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(worker, range(32)))
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    for offset, result in enumerate(results):
+        locales = list(expected)
+        assert result == [
+            expected[locales[(offset + i) % len(locales)]] for i in range(200)
+        ]
+    assert sorted(loads) == ["de_DE", "fr_FR", "ru_RU"]
+    assert humanize.i18n._get_locale() is None
+
+
+def test_locale_context_manager() -> None:
+    try:
+        with humanize.i18n.locale("fr_FR") as translation:
+            assert translation is humanize.i18n.get_translation()
+            assert humanize.naturaldelta(3) == "3 secondes"
+            with humanize.i18n.locale("de_DE"):
+                assert humanize.naturaldelta(3) == "3 Sekunden"
+            assert humanize.naturaldelta(3) == "3 secondes"
+            with humanize.i18n.locale("en_GB"):
+                assert humanize.naturaldelta(3) == "3 seconds"
+            assert humanize.naturaldelta(3) == "3 secondes"
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    assert humanize.naturaldelta(3) == "3 seconds"
+
+    msg = "oops"
+    with pytest.raises(ValueError, match=msg), humanize.i18n.locale("fr_FR"):
+        raise ValueError(msg)
+    assert humanize.naturaldelta(3) == "3 seconds"
+
+
+def test_locale_asyncio_tasks() -> None:
+    import asyncio
+
+    async def format_in(locale: str) -> list[str]:
+        results = []
+        humanize.i18n.activate(locale)
+        for _ in range(3):
+            await asyncio.sleep(0)
+            results.append(humanize.naturaldelta(3))
+        return results
+
+    async def main() -> tuple[list[str], list[str]]:
+        return await asyncio.gather(format_in("fr_FR"), format_in("de_DE"))
+
+    try:
+        fr, de = asyncio.run(main())
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+
+    assert fr == ["3 secondes"] * 3
+    assert de == ["3 Sekunden"] * 3
+    assert humanize.naturaldelta(3) == "3 seconds"
@@ -0,0 +1,55 @@
+"""Tests for the lazy top-level package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import humanize
+
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Return the modules `code` imports, with their cumulative import time (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_is_lazy() -> None:
+    baseline = _imported_modules("pass")
+    modules = _imported_modules("import humanize")
+
+    new = set(modules) - set(baseline)
+    assert new <= {"humanize", "__future__"}, (
+        f"`import humanize` imported {sorted(new - {'humanize', '__future__'})} "
+        f"and took {modules['humanize']} us"
+    )
+
+
+def test_getattr() -> None:
+    for name in humanize.__all__:
+        assert getattr(humanize, name) is not None
+    assert humanize.naturalsize is humanize.filesize.naturalsize
+    assert humanize.i18n.activate is humanize.activate
+    assert humanize.stream.intcomma([1_000]) is not None
+
+    with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+        humanize.nope
+
+
+def test_dir() -> None:
+    names = dir(humanize)
+    assert set(humanize.__all__) <= set(names)
+    assert {"i18n", "stream", "time"} <= set(names)
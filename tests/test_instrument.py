@@ -0,0 +1,126 @@
+"""Tests for the opt-in instrumentation."""
+
+from __future__ import annotations
+
+import datetime as dt
+import math
+import threading
+import typing
+
+import pytest
+
+import humanize
+from humanize import instrument
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _clean() -> Iterator[None]:
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_enable_and_disable() -> None:
+    original = humanize.naturalsize
+    assert not instrument.is_enabled()
+
+    instrument.enable()
+    instrument.enable()
+    assert instrument.is_enabled()
+    assert humanize.naturalsize is not original
+    assert humanize.naturalsize.__wrapped__ is original  # type: ignore[attr-defined]
+    assert humanize.naturalsize(3_000) == "3.0 kB"
+
+    instrument.disable()
+    assert not instrument.is_enabled()
+    assert humanize.naturalsize is original
+    assert humanize.naturalsize(3_000) == "3.0 kB"
+    assert instrument.snapshot()["naturalsize"]["calls"] == 1
+
+
+def test_snapshot() -> None:
+    instrument.enable()
+    for value in (1, 1_000, 10**9):
+        humanize.intword(value)
+    humanize.naturaldelta(dt.timedelta(minutes=3))
+
+    snapshot = instrument.snapshot()
+    assert list(snapshot) == ["intword", "naturaldelta"]
+    stats = snapshot["intword"]
+    assert stats["calls"] == 3
+    assert stats["seconds"] > 0
+    assert sum(stats["histogram"].values()) == 3
+    assert list(stats["histogram"]) == list(instrument.BUCKETS)
+    assert max(stats["histogram"]) == math.inf
+    assert stats["fallbacks"] == {}
+
+    # A snapshot is a copy
+    stats["calls"] = 0
+    assert instrument.snapshot()["intword"]["calls"] == 3
+
+    instrument.reset()
+    assert instrument.snapshot() == {}
+
+
+def test_fallbacks() -> None:
+    instrument.enable()
+    humanize.intcomma("lots")
+    humanize.intcomma(float("nan"))
+    humanize.intcomma(1_000)
+    humanize.metric(1e40, "V")
+    humanize.metric_many([1e40, 1e-40, 5], "V")
+    humanize.naturaldelta("NaN")  # type: ignore[arg-type]
+    humanize.naturalday("bad")  # type: ignore[arg-type]
+    humanize.scientific_many(["x", float("inf")])
+
+    snapshot = instrument.snapshot()
+    assert snapshot["intcomma"]["fallbacks"] == {"str": 1, "not_finite": 1}
+    assert snapshot["metric"]["fallbacks"] == {"scientific": 1}
+    assert snapshot["metric_many"]["fallbacks"] == {"scientific": 2}
+    assert snapshot["naturaldelta"]["fallbacks"] == {"str": 1}
+    assert snapshot["naturalday"]["fallbacks"] == {"str": 1}
+    assert snapshot["scientific_many"]["fallbacks"] == {"str": 1, "not_finite": 1}
+
+
+def test_not_recorded_when_disabled() -> None:
+    from humanize import number
+
+    instrument.enable()
+    intcomma = humanize.intcomma
+    instrument.disable()
+    assert number._on_fallback is None
+
+    intcomma("lots")
+    humanize.intcomma("lots")
+    assert instrument.snapshot() == {}
+
+
+def test_only_public_functions() -> None:
+    instrument.enable()
+    # Classes and the version are left alone
+    assert isinstance(humanize.NumberFormatter(), humanize.NumberFormatter)
+    assert isinstance(humanize.__version__, str)
+    humanize.NumberFormatter()("lots")
+    assert instrument.snapshot() == {}
+
+
+def test_threads() -> None:
+    instrument.enable()
+
+    def worker() -> None:
+        for _ in range(500):
+            humanize.intcomma("lots")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = instrument.snapshot()["intcomma"]
+    assert stats["calls"] == 4_000
+    assert stats["fallbacks"] == {"str": 4_000}
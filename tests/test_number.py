@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import math
+import random
 import typing
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal, localcontext
+from fractions import Fraction
 
 import pytest
 
@@ -38,6 +42,23 @@ def test_ordinal(test_input: str, expected: str) -> None:
     assert humanize.ordinal(test_input) == expected
 
 
+def test_ordinal_many() -> None:
+    values: list[typing.Any] = [0, 1, "2", 3.5, 11, 112, -1, -13, 10**30, None, "x"]
+    values += [math.nan, -math.inf, True]
+    for gender in ("male", "female", "other"):
+        expected = [humanize.ordinal(value, gender) for value in values]
+        assert humanize.ordinal_many(values, gender) == expected
+        assert humanize.ordinal_many(iter(values), gender) == expected
+
+
+def test_ordinal_many_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    for array in (np.arange(-150, 150), np.array([1.0, 22.9, math.nan, -math.inf])):
+        expected = [humanize.ordinal(value) for value in array.tolist()]
+        assert humanize.ordinal_many(array) == expected
+
+
 @pytest.mark.parametrize(
     "test_args, expected",
     [
@@ -57,6 +78,13 @@ def test_ordinal(test_input: str, expected: str) -> None:
         (["1234567.1234567", 1], "1,234,567.1"),
         (["1234567.1234567", 10], "1,234,567.1234567000"),
         (["1234567", 1], "1,234,567.0"),
+        (["-1000000"], "-1,000,000"),
+        (["007"], "7"),
+        ([-1234567, 2], "-1,234,567.00"),
+        (["1234567", 0], "1,234,567"),
+        # Integers are never converted to float, so they stay exact
+        ([10**17 + 1], "100,000,000,000,000,001"),
+        ([10**17 + 1, 2], "100,000,000,000,000,001.00"),
         ([None], "None"),
         ([14308.40], "14,308.4"),
         ([14308.40, None], "14,308.4"),
@@ -83,6 +111,13 @@ def test_intcomma(
     assert humanize.intcomma(*test_args) == expected
 
 
+def test_intcomma_huge_int() -> None:
+    # Too large for a float, but formatted exactly
+    assert humanize.intcomma(10**399) == "1" + ",000" * 133
+    assert humanize.intcomma(-(10**399)) == "-1" + ",000" * 133
+    assert humanize.intcomma("1" * 400) == "1" + ",111" * 133
+
+
 def test_intword_powers() -> None:
     # make sure that powers & human_powers have the same number of items
     assert len(number.powers) == len(number.human_powers)
@@ -135,12 +170,116 @@ def test_intword_powers() -> None:
         (["1234567", "%.3f"], "1.235 million"),
         (["999500", "%.0f"], "1 million"),
         (["999499", "%.0f"], "999 thousand"),
+        ([999_698 * 10**21, "%.0f"], "1 octillion"),
+        ([1_250_000], "1.2 million"),
+        ([1_350_000], "1.4 million"),
+        ([1_815, "%.2f"], "1.81 thousand"),
+        ([1_050_000], "1.1 million"),
+        ([1_150_000], "1.1 million"),
+        ([1_950_000], "1.9 million"),
+        ([-1_050_000], "-1.1 million"),
+        ([1_050 * 10**18], "1.1 sextillion"),
+        ([10**400], "1" + "0" * 300 + ".0 googol"),
+        ([871_293 * 10**69], "871293000000000000000000000000000000000000.0 decillion"),
     ],
 )
 def test_intword(test_args: list[str], expected: str) -> None:
     assert humanize.intword(*test_args) == expected
 
 
+@pytest.mark.parametrize("precision", [0, 1, 3, 20])
+def test_intword_exact(precision: int) -> None:
+    # Ints are scaled and rounded without going through float. Exact halves round
+    # as the float of the quotient does, which is what "%.Nf" used to do.
+    rng = random.Random(0)
+    with localcontext(prec=200):
+        for _ in range(1_000):
+            value = rng.randint(1_000, 10 ** rng.randint(4, 120))
+            # Make ties and trailing zeros common
+            value += 5 * 10 ** rng.randint(0, 3) - value % 10 ** rng.randint(0, 10)
+            value = max(value, 1_000)
+            exponents = [len(str(power)) - 1 for power in number.powers]
+            ordinal = bisect.bisect_right(number.powers, value) - 1
+            exact = Decimal(value).scaleb(-exponents[ordinal])
+            step = Decimal(1).scaleb(-precision)
+            rounded = exact.quantize(step, ROUND_HALF_EVEN)
+            quotient = Decimal(value / number.powers[ordinal])
+            if abs(exact - rounded) == step / 2 and quotient != exact:
+                rounding = ROUND_CEILING if quotient > exact else ROUND_FLOOR
+                rounded = exact.quantize(step, rounding)
+            if rounded == 1_000 and ordinal < 10:
+                ordinal, rounded = ordinal + 1, rounded.scaleb(-3)
+            expected = f"{rounded:f} {number.human_powers[ordinal][0]}"
+            assert humanize.intword(value, f"%.{precision}f") == expected
+
+
+def test_intword_tables_threads() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # More formats than the cache holds, so threads keep clearing it
+    formats = [f"%.{digits}f" for digits in range(2 * number._MAX_INTWORD_TABLES)]
+    expected = [humanize.intword(12_345_678, format) for format in formats]
+
+    def worker(offset: int) -> list[str]:
+        return [
+            humanize.intword(12_345_678, formats[(offset + i) % len(formats)])
+            for i in range(len(formats) * 4)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(8)))
+    for offset, result in enumerate(results):
+        assert result == [
+            expected[(offset + i) % len(formats)] for i in range(len(formats) * 4)
+        ]
+
+
+INTWORD_MANY_VALUES: list[typing.Any] = [
+    0,
+    -999,
+    "12490",
+    1_250_000,
+    "-1000000",
+    999_999_999,
+    999_698 * 10**21,
+    10**100,
+    2e100,
+    10**400,
+    1_234.5,
+    None,
+    "lots",
+    math.nan,
+    -math.inf,
+]
+
+
+@pytest.mark.parametrize("format", ["%.1f", "%.0f", "%0.3f", "%d", "%.2e"])
+def test_intword_many(format: str) -> None:
+    expected = [humanize.intword(value, format) for value in INTWORD_MANY_VALUES]
+    assert humanize.intword_many(INTWORD_MANY_VALUES, format) == expected
+    assert humanize.intword_many(iter(INTWORD_MANY_VALUES), format) == expected
+
+
+@pytest.mark.parametrize("format", ["%.1f", "%.0f", "%d"])
+def test_intword_many_numpy(format: str) -> None:
+    np = pytest.importorskip("numpy")
+
+    rng = random.Random(0)
+    values = [0, 1_000, -999_950, 2**63 - 1, -(2**63)]
+    values += [
+        rng.randint(-(10**18), 10**18) // 10 ** rng.randint(0, 15) for _ in range(500)
+    ]
+    for array in (
+        np.array(values, dtype=np.int64),
+        np.array([abs(value) for value in values], dtype=np.uint64),
+        np.array([2**64 - 1, 10**19, 999], dtype=np.uint64),
+        np.array([-128, 100, 127], dtype=np.int8),
+        np.array([1_250_000.5, -1e30, math.nan, 5e18]),
+    ):
+        expected = [humanize.intword(value, format) for value in array.tolist()]
+        assert humanize.intword_many(array, format) == expected
+
+
 @pytest.mark.parametrize(
     "test_input, expected",
     [
@@ -193,6 +332,32 @@ def test_fractional(test_input: float | str, expected: str) -> None:
     assert humanize.fractional(test_input) == expected
 
 
+def test_limit_denominator() -> None:
+    rng = random.Random(0)
+    values = [n / d for d in range(1, 40) for n in range(-2 * d, 2 * d)]
+    values += [rng.uniform(-1, 1) for _ in range(1_000)] + [0.0005, -0.9999, 5e-324]
+    for value in values:
+        fraction = Fraction(value).limit_denominator(1_000)
+        expected = (fraction.numerator, fraction.denominator)
+        assert number._limit_denominator(value) == expected
+
+
+def test_fractional_many() -> None:
+    values: list[typing.Any] = [0, 0.5, -2.25, 1 / 3, "8.9", 1e20, None, "x", math.nan]
+    expected = [humanize.fractional(value) for value in values]
+    assert humanize.fractional_many(values) == expected
+    assert humanize.fractional_many(iter(values)) == expected
+    assert number._fractional.cache_info().maxsize == 1_024
+
+
+def test_fractional_many_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    for array in (np.linspace(-3, 3, 97), np.arange(-5, 5), np.array([np.inf])):
+        expected = [humanize.fractional(value) for value in array.tolist()]
+        assert humanize.fractional_many(array) == expected
+
+
 @pytest.mark.parametrize(
     "test_args, expected",
     [
@@ -315,3 +480,107 @@ def test_clamp(test_args: list[typing.Any], expected: str) -> None:
 )
 def test_metric(test_args: list[typing.Any], expected: str) -> None:
     assert humanize.metric(*test_args) == expected
+
+
+@pytest.mark.parametrize("ndigits", [None, 0, 2])
+def test_number_formatter(ndigits: int | None) -> None:
+    values: list[typing.Any] = [
+        100,
+        -1000,
+        "10311",
+        1_234_567.25,
+        "1234567.1234567",
+        math.nan,
+        None,
+    ]
+    fmt = humanize.NumberFormatter(ndigits)
+    expected = [humanize.intcomma(value, ndigits) for value in values]
+    assert [fmt(value) for value in values] == expected
+    assert fmt.format_many(values) == expected
+
+
+@pytest.mark.parametrize("format", ["%.1f", "%.3f", "%.0f"])
+def test_number_formatter_intword_metric(format: str) -> None:
+    fmt = humanize.NumberFormatter(format=format)
+    values: list[typing.Any] = ["100", "12490", -1_290_000, "999999999", 2e100, None]
+    for value in values:
+        assert fmt.intword(value) == humanize.intword(value, format)
+    assert fmt.metric(1500, "V") == humanize.metric(1500, "V")
+    assert fmt.metric(220e-6, "F", 2) == humanize.metric(220e-6, "F", 2)
+
+
+METRIC_MANY_VALUES = [
+    0.0,
+    -0.0,
+    1.0,
+    1500,
+    -2e8,
+    220e-6,
+    999.5,
+    999.4999,
+    999_999,
+    999.9995,
+    1e-14,
+    1e-30,
+    9.995e-31,
+    1e30,
+    9.9999e32,
+    1e33,
+    1e40,
+    1e23,
+    *(10.0**exponent for exponent in range(-32, 35)),
+    math.inf,
+    -math.inf,
+    math.nan,
+]
+
+
+@pytest.mark.parametrize("unit", ["", "V", "°"])
+@pytest.mark.parametrize("precision", [1, 3, 5])
+def test_metric_many(unit: str, precision: int) -> None:
+    expected = [humanize.metric(value, unit, precision) for value in METRIC_MANY_VALUES]
+    assert humanize.metric_many(METRIC_MANY_VALUES, unit, precision) == expected
+
+
+@pytest.mark.parametrize("unit", ["", "V", "°"])
+@pytest.mark.parametrize("precision", [1, 3, 5])
+def test_metric_many_numpy(unit: str, precision: int) -> None:
+    np = pytest.importorskip("numpy")
+
+    values = np.array(METRIC_MANY_VALUES)
+    expected = [humanize.metric(value, unit, precision) for value in values.tolist()]
+    assert humanize.metric_many(values, unit, precision) == expected
+
+    integers = np.array([0, 1, -999, 1000, 999_999, 10**18, -(2**62)], dtype=np.int64)
+    expected = [humanize.metric(value, unit, precision) for value in integers]
+    assert humanize.metric_many(integers, unit, precision) == expected
+
+
+@pytest.mark.parametrize("precision", [3, 17, 20])
+def test_metric_many_numpy_large_integers(precision: int) -> None:
+    np = pytest.importorskip("numpy")
+
+    # Not representable as float64: each must match `metric` on the exact int
+    values = [5611633825035178630, -410106663671258472, 2**53 + 1, 2**63 - 1, 7]
+    integers = np.array(values, dtype=np.int64)
+    expected = [humanize.metric(value, "V", precision) for value in values]
+    assert humanize.metric_many(integers, "V", precision) == expected
+
+    unsigned = np.array([2**64 - 1, 2**53 + 3, 0], dtype=np.uint64)
+    expected = [humanize.metric(value, "V", precision) for value in unsigned.tolist()]
+    assert humanize.metric_many(unsigned, "V", precision) == expected
+
+
+@pytest.mark.parametrize("precision", [0, 2, 4])
+def test_scientific_many(precision: int) -> None:
+    values: list[typing.Any] = [0.3, -1000, "99", "foo", None, 9.999e-50, math.nan]
+    expected = [humanize.scientific(value, precision) for value in values]
+    assert humanize.scientific_many(values, precision) == expected
+
+
+def test_scientific_many_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    values = np.array(METRIC_MANY_VALUES)
+    expected = [humanize.scientific(value) for value in values.tolist()]
+    assert humanize.scientific_many(values) == expected
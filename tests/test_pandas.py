@@ -0,0 +1,161 @@
+"""Tests for the pandas accessor."""
+
+from __future__ import annotations
+
+import datetime as dt
+import random
+import typing
+
+import pytest
+
+import humanize
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+import humanize.pandas  # noqa: E402
+
+
+def expected(
+    series: typing.Any, func: typing.Callable[..., str], *args: typing.Any
+) -> list[str | None]:
+    return [None if pd.isna(v) else func(v, *args) for v in series.tolist()]
+
+
+def result(series: typing.Any) -> list[str | None]:
+    return [None if pd.isna(v) else v for v in series.tolist()]
+
+
+def test_accessor_keeps_index_and_name() -> None:
+    series = pd.Series([1_000, None, 3], index=["a", "b", "c"], name="bytes")
+    sizes = series.humanize.naturalsize()
+    assert sizes.index.tolist() == ["a", "b", "c"]
+    assert sizes.name == "bytes"
+    assert result(sizes) == ["1.0 kB", None, "3 Bytes"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0, 1, 999, 1_000, 999_999, 10**15, -4096, 2**62],
+        [0.0, 1.5, float("nan"), 1e30, -999_950.0, 123_456_789.0],
+        ["1000", "2048", None],
+    ],
+)
+@pytest.mark.parametrize("binary, gnu", [(False, False), (True, False), (False, True)])
+def test_naturalsize(values: list[typing.Any], binary: bool, gnu: bool) -> None:
+    series = pd.Series(values)
+    assert result(series.humanize.naturalsize(binary, gnu)) == expected(
+        series, humanize.naturalsize, binary, gnu
+    )
+
+
+@pytest.mark.parametrize("fmt", ["%.3f", "%d", "%.2e"])
+def test_naturalsize_format(fmt: str) -> None:
+    rng = random.Random(0)
+    series = pd.Series([10 ** rng.uniform(0, 20) for _ in range(1_000)])
+    assert result(series.humanize.naturalsize(format=fmt)) == expected(
+        series, humanize.naturalsize, False, False, fmt
+    )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0, 1_000, -1_234_567, 10**18],
+        [1_234.5, float("nan"), -0.25],
+        ["1234567", None, "1000.5"],
+    ],
+)
+def test_intcomma(values: list[typing.Any]) -> None:
+    series = pd.Series(values)
+    assert result(series.humanize.intcomma()) == expected(series, humanize.intcomma)
+    assert result(series.humanize.intcomma(2)) == expected(series, humanize.intcomma, 2)
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([1, None, 2**60 + 1, -(2**62)], "Int64"),
+        ([1, 2, 2**60 + 1], "Int64"),
+        ([0, None, 2**64 - 1], "UInt64"),
+        ([1.5, None, 1e30, -0.25], "Float64"),
+        ([1_000, None, 86_400], "Int32"),
+    ],
+)
+def test_nullable(values: list[typing.Any], dtype: str) -> None:
+    series = pd.Series(values, dtype=dtype)
+    present = series.dropna()
+    scalars = [None if pd.isna(v) else v for v in series.astype(object).tolist()]
+
+    def expected_(func: typing.Callable[..., str]) -> list[str | None]:
+        return [None if v is None else func(v) for v in scalars]
+
+    assert result(series.humanize.intcomma()) == expected_(humanize.intcomma)
+    assert result(series.humanize.naturalsize()) == expected_(humanize.naturalsize)
+    if present.abs().max() < 2**46:
+        assert result(series.humanize.naturaldelta()) == expected_(
+            humanize.naturaldelta
+        )
+    if dtype == "Int64" and len(present) < len(series):
+        assert result(series.humanize.intcomma())[2] == "1,152,921,504,606,846,977"
+
+
+@pytest.mark.parametrize("months", [True, False])
+@pytest.mark.parametrize("minimum_unit", ["seconds", "milliseconds", "microseconds"])
+def test_naturaldelta(months: bool, minimum_unit: str) -> None:
+    rng = random.Random(0)
+    deltas = [
+        dt.timedelta(microseconds=rng.choice([-1, 1]) * int(10 ** rng.uniform(0, 16)))
+        for _ in range(2_000)
+    ]
+    seconds = [int(delta.total_seconds()) for delta in deltas]
+    for values in (
+        pd.Series(deltas + [None]),
+        pd.Series(seconds),
+        pd.Series([float(s) / 7 for s in seconds] + [float("nan")]),
+        pd.Series([2**46 + 5, -3, 86_400]),
+        pd.Series(deltas[:10] + [30, 4.5], dtype=object),
+    ):
+        assert result(values.humanize.naturaldelta(months, minimum_unit)) == expected(
+            values, humanize.naturaldelta, months, minimum_unit
+        )
+
+
+def test_naturaldelta_bad_minimum_unit() -> None:
+    with pytest.raises(ValueError, match="Minimum unit 'hours' not supported"):
+        pd.Series([1]).humanize.naturaldelta(minimum_unit="hours")
+
+
+def test_dataframe() -> None:
+    frame = pd.DataFrame(
+        {"rx": [1_000, 2_500_000], "tx": [10, 4_000]}, index=["eth0", "eth1"]
+    )
+    sizes = frame.humanize.naturalsize()
+    assert sizes.columns.tolist() == ["rx", "tx"]
+    assert sizes.index.tolist() == ["eth0", "eth1"]
+    assert sizes.to_dict() == {
+        "rx": {"eth0": "1.0 kB", "eth1": "2.5 MB"},
+        "tx": {"eth0": "10 Bytes", "eth1": "4.0 kB"},
+    }
+    assert frame.humanize.intcomma().to_dict()["rx"] == {
+        "eth0": "1,000",
+        "eth1": "2,500,000",
+    }
+    assert frame.humanize.naturaldelta().to_dict()["tx"] == {
+        "eth0": "10 seconds",
+        "eth1": "an hour",
+    }
+    assert frame.iloc[:, :0].humanize.naturalsize().shape == (2, 0)
+
+
+def test_locale() -> None:
+    series = pd.Series([dt.timedelta(seconds=3), 1_234 * 365 * 24 * 60 * 60])
+    try:
+        humanize.i18n.activate("fr_FR")
+        assert series.humanize.naturaldelta().tolist() == ["3 secondes", "1 234 ans"]
+        assert pd.Series([1_000_000]).humanize.intcomma().tolist() == ["1 000 000"]
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
@@ -0,0 +1,107 @@
+"""Tests for the lazy stream adapters."""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+import typing
+
+import pytest
+
+import humanize
+from humanize import stream
+
+NUMBERS: list[typing.Any] = [0, 1, 999, 1_000, "1234567", -1_234_567.891, 10**30, "x"]
+DELTAS: list[typing.Any] = [
+    0,
+    1.5,
+    dt.timedelta(microseconds=4),
+    dt.timedelta(minutes=59, seconds=59.999),
+    dt.timedelta(days=-400),
+    dt.timedelta(days=2, seconds=3633, microseconds=123000),
+    "NaN",
+]
+
+
+def test_intcomma() -> None:
+    values = NUMBERS[:-1]
+    assert list(stream.intcomma(values)) == [humanize.intcomma(v) for v in values]
+    assert list(stream.intcomma(values, 2)) == [humanize.intcomma(v, 2) for v in values]
+
+
+def test_intword() -> None:
+    assert list(stream.intword(NUMBERS)) == [humanize.intword(v) for v in NUMBERS]
+    assert list(stream.intword(NUMBERS, "%.3f")) == [
+        humanize.intword(v, "%.3f") for v in NUMBERS
+    ]
+
+
+@pytest.mark.parametrize("binary, gnu", [(False, False), (True, False), (False, True)])
+def test_naturalsize(binary: bool, gnu: bool) -> None:
+    values = NUMBERS[:-1]
+    assert list(stream.naturalsize(values, binary, gnu)) == [
+        humanize.naturalsize(v, binary, gnu) for v in values
+    ]
+
+
+def test_naturaldelta() -> None:
+    assert list(stream.naturaldelta(DELTAS, months=False)) == [
+        humanize.naturaldelta(v, months=False) for v in DELTAS
+    ]
+
+
+def test_precisedelta() -> None:
+    assert list(stream.precisedelta(DELTAS, suppress=["days"])) == [
+        humanize.precisedelta(v, suppress=["days"]) for v in DELTAS
+    ]
+
+
+def test_naturaltime() -> None:
+    when = dt.datetime(2024, 1, 1, 12, 0)
+    values: list[typing.Any] = [
+        when - dt.timedelta(hours=3),
+        when + dt.timedelta(days=2),
+        30,
+        "NaN",
+    ]
+    result = stream.naturaltime(values, future=True, when=when)
+    assert list(result) == humanize.naturaltime_many(values, future=True, when=when)
+
+
+def test_lazy() -> None:
+    sizes = stream.naturalsize(itertools.count(1_000, 1_000))
+    assert list(itertools.islice(sizes, 3)) == ["1.0 kB", "2.0 kB", "3.0 kB"]
+    assert next(sizes) == "4.0 kB"
+
+    seen: list[int] = []
+
+    def source() -> typing.Iterator[int]:
+        for i in range(3):
+            seen.append(i)
+            yield i
+
+    numbers = stream.intcomma(source())
+    assert seen == []
+    assert next(numbers) == "0"
+    assert seen == [0]
+
+
+def test_binds_locale_at_creation() -> None:
+    try:
+        humanize.i18n.activate("fr_FR")
+        deltas = stream.naturaldelta([3, 120])
+        times = stream.naturaltime([dt.timedelta(seconds=3)])
+    except FileNotFoundError:
+        pytest.skip("Generate .mo with scripts/generate-translation-binaries.sh")
+    finally:
+        humanize.i18n.deactivate()
+
+    assert list(deltas) == ["3 secondes", "2 minutes"]
+    assert list(times) == ["il y a 3 secondes"]
+
+
+def test_bad_options_fail_at_creation() -> None:
+    with pytest.raises(ValueError, match="Minimum unit 'hours' not supported"):
+        stream.naturaldelta([], minimum_unit="hours")
+    with pytest.raises(ValueError, match="Minimum unit 'hours' not supported"):
+        stream.naturaltime([], minimum_unit="hours")
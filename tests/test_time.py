@@ -815,6 +815,42 @@ def test_precisedelta_suppress_units(
     )
 
 
+@pytest.mark.parametrize(
+    "val, min_unit, fmt, expected",
+    [
+        (dt.timedelta(days=400, seconds=5), "years", "%0.2f", "1.10 years"),
+        (
+            dt.timedelta(days=365, seconds=5),
+            "years",
+            "%0.2f",
+            "1 year and 5000000 microseconds",
+        ),
+        (dt.timedelta(days=31, hours=13), "days", "%0.2f", "1 month and 0.54 days"),
+        (dt.timedelta(days=61, hours=13), "hours", "%0.2f", "2 months and 13 hours"),
+        (
+            dt.timedelta(days=90, seconds=59.999),
+            "seconds",
+            "%d",
+            "2 months, 29 days and 59 seconds",
+        ),
+        (dt.timedelta(minutes=59, seconds=59.999), "seconds", "%0.2f", "1 hour"),
+    ],
+)
+def test_precisedelta_rounding_and_carry(
+    val: dt.timedelta, min_unit: str, fmt: str, expected: str
+) -> None:
+    assert humanize.precisedelta(val, minimum_unit=min_unit, format=fmt) == expected
+
+
+def test_precisedelta_suppress_iterables() -> None:
+    delta = dt.timedelta(days=2, hours=1)
+    expected = "49 hours"
+    assert humanize.precisedelta(delta, suppress=["days"]) == expected
+    assert humanize.precisedelta(delta, suppress=("days",)) == expected
+    assert humanize.precisedelta(delta, suppress={"days"}) == expected
+    assert humanize.precisedelta(delta, suppress=(u for u in ["days"])) == expected
+
+
 def test_precisedelta_bogus_call() -> None:
     assert humanize.precisedelta(None) == "None"
 
@@ -852,3 +888,175 @@ def test_time_unit() -> None:
 )
 def test_rounding_by_fmt(fmt: str, value: float, expected: float) -> None:
     assert time._rounding_by_fmt(fmt, value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("months", [True, False])
+@pytest.mark.parametrize("minimum_unit", ["seconds", "milliseconds", "microseconds"])
+def test_delta_formatter(months: bool, minimum_unit: str) -> None:
+    values: list[typing.Any] = [
+        0,
+        1,
+        23.5,
+        FOUR_MICROSECONDS,
+        MICROSECONDS_101_943,
+        dt.timedelta(minutes=59, seconds=30),
+        dt.timedelta(days=-400),
+        dt.timedelta(days=365 * 1_141),
+        "NaN",
+    ]
+    fmt = humanize.DeltaFormatter(months, minimum_unit)
+    expected = [humanize.naturaldelta(value, months, minimum_unit) for value in values]
+    assert [fmt(value) for value in values] == expected
+    assert fmt.format_many(values) == expected
+
+
+def test_delta_formatter_bad_minimum_unit() -> None:
+    with pytest.raises(ValueError, match="Minimum unit 'hours' not supported"):
+        humanize.DeltaFormatter(minimum_unit="hours")
+
+
+@pytest.mark.parametrize(
+    "minimum_unit, suppress, format",
+    [
+        ("seconds", (), "%0.2f"),
+        ("microseconds", (), "%0.2f"),
+        ("minutes", ["hours"], "%d"),
+        ("years", (), "%0.1f"),
+        ("hours", ["hours", "days"], "%0.4f"),
+    ],
+)
+def test_precise_delta_formatter(
+    minimum_unit: str, suppress: list[str], format: str
+) -> None:
+    values: list[typing.Any] = [
+        0,
+        1,
+        23.5,
+        FOUR_MICROSECONDS,
+        MICROSECONDS_101_943,
+        dt.timedelta(minutes=59, seconds=59.999),
+        dt.timedelta(days=2, seconds=3633, microseconds=123000),
+        dt.timedelta(days=-400),
+        dt.timedelta(days=365 * 1_141, seconds=5),
+        None,
+        "NaN",
+    ]
+    fmt = humanize.PreciseDeltaFormatter(minimum_unit, suppress, format)
+    expected = [
+        humanize.precisedelta(value, minimum_unit, suppress, format) for value in values
+    ]
+    assert [fmt(value) for value in values] == expected
+    assert fmt.format_many(values) == expected
+    assert fmt.format_many(iter(values)) == expected
+
+
+def test_precise_delta_formatter_bad_units() -> None:
+    with pytest.raises(KeyError):
+        humanize.PreciseDeltaFormatter(minimum_unit="fortnights")
+    with pytest.raises(ValueError, match="Minimum unit is suppressed"):
+        humanize.PreciseDeltaFormatter(minimum_unit="years", suppress=["years"])
+
+
+@pytest.fixture
+def naturaldelta_cache() -> typing.Iterator[None]:
+    time.cache_naturaldelta(maxsize=16)
+    yield
+    time.cache_naturaldelta(maxsize=0)
+
+
+@pytest.mark.usefixtures("naturaldelta_cache")
+@pytest.mark.parametrize("months", [True, False])
+@pytest.mark.parametrize("minimum_unit", ["seconds", "milliseconds", "microseconds"])
+def test_naturaldelta_cached(months: bool, minimum_unit: str) -> None:
+    values: list[typing.Any] = [
+        0,
+        1,
+        23.5,
+        FOUR_MICROSECONDS,
+        MICROSECONDS_101_943,
+        dt.timedelta(minutes=1, seconds=30),
+        dt.timedelta(minutes=1, seconds=59),
+        dt.timedelta(days=-400),
+        dt.timedelta(days=365 * 1_141),
+        "NaN",
+    ]
+    expected = [humanize.DeltaFormatter(months, minimum_unit)(v) for v in values]
+    for _ in range(2):
+        assert [
+            humanize.naturaldelta(value, months, minimum_unit) for value in values
+        ] == expected
+
+
+@pytest.mark.usefixtures("naturaldelta_cache")
+def test_naturaldelta_cache_info() -> None:
+    # 90 and 149 seconds both render "2 minutes" from one cache entry
+    assert humanize.naturaldelta(90) == "2 minutes"
+    assert humanize.naturaldelta(149) == "2 minutes"
+    assert humanize.naturaldelta(151) == "3 minutes"
+    info = time.naturaldelta_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 2, 16, 2)
+
+    time.naturaldelta_cache_clear()
+    info = time.naturaldelta_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_naturaldelta_cache_off_by_default() -> None:
+    humanize.naturaldelta(90)
+    assert time.naturaldelta_cache_info().misses == 0
+
+
+@freeze_time(FROZEN_DATE)
+@pytest.mark.parametrize("future", [True, False])
+@pytest.mark.parametrize("when", [None, NOW_UTC, NOW - dt.timedelta(days=3)])
+def test_naturaltime_many(future: bool, when: dt.datetime | None) -> None:
+    values: list[typing.Any] = [
+        NOW,
+        NOW - dt.timedelta(minutes=1, seconds=30),
+        NOW + dt.timedelta(days=500),
+        NOW_UTC - dt.timedelta(hours=23, minutes=50, seconds=50),
+        NOW_UTC_PLUS_01_00 + dt.timedelta(seconds=30),
+        dt.timedelta(days=-10000),
+        dt.timedelta(milliseconds=4),
+        23.5,
+        30,
+        "NaN",
+    ]
+    expected = [humanize.naturaltime(value, future, when=when) for value in values]
+    assert humanize.naturaltime_many(values, future, when=when) == expected
+
+
+@freeze_time(FROZEN_DATE)
+def test_naturaltime_many_minimum_unit() -> None:
+    values: list[typing.Any] = [
+        dt.timedelta(milliseconds=4),
+        dt.timedelta(microseconds=4),
+        0,
+    ]
+    assert humanize.naturaltime_many(values, minimum_unit="microseconds") == [
+        "4 milliseconds ago",
+        "4 microseconds ago",
+        "0 microseconds ago",
+    ]
+    assert humanize.naturaltime_many(values) == ["now", "now", "now"]
+
+
+def test_naturaltime_many_reads_now_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[None] = []
+
+    def fake_now() -> dt.datetime:
+        # Every call moves the clock on, so rows would drift if it were re-read
+        calls.append(None)
+        now: dt.datetime = NOW + dt.timedelta(minutes=len(calls))
+        return now
+
+    monkeypatch.setattr(time, "_now", fake_now)
+    values: list[typing.Any] = [NOW, NOW, dt.timedelta(days=-1), -30, NOW]
+    assert humanize.naturaltime_many(values) == [
+        "a minute ago",
+        "a minute ago",
+        "a day from now",
+        "30 seconds ago",
+        "a minute ago",
+    ]
+    assert len(calls) == 1